@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassifierState:
     content: str  # Original content
     content_types: Dict[str, str] = field(default_factory=dict)  # Content types
@@ -5,6 +5,7 @@ This module defines the Article entity, which represents a news article
 in the classification system with all its properties and business rules.
 """
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -36,6 +37,25 @@ class ContentType(Enum):
     UNKNOWN = "unknown"
 
 
+# Content type indicators, one group per type in detection priority order. The lookahead
+# tests every position, so overlapping indicators are all seen in a single scan.
+_CONTENT_TYPE_RE = re.compile(
+    r"(?=(press release|business wire|pr newswire)"
+    r"|(research|study|analysis|report)"
+    r"|(opinion|editorial|commentary)"
+    r"|(blog|post|author:)"
+    r"|(news|breaking|reported|announced))",
+    re.IGNORECASE,
+)
+_CONTENT_TYPE_BY_GROUP = (
+    ContentType.PRESS_RELEASE,
+    ContentType.RESEARCH_PAPER,
+    ContentType.OPINION,
+    ContentType.BLOG_POST,
+    ContentType.NEWS_ARTICLE,
+)
+
+
 @dataclass
 class Article:
     """
@@ -102,20 +122,14 @@ class Article:
 
     def _set_content_type(self) -> None:
         """Automatically determine content type based on content and metadata"""
-        content_lower = self.content.lower()
-
-        if any(indicator in content_lower for indicator in ["press release", "business wire", "pr newswire"]):
-            self.content_type = ContentType.PRESS_RELEASE
-        elif any(indicator in content_lower for indicator in ["research", "study", "analysis", "report"]):
-            self.content_type = ContentType.RESEARCH_PAPER
-        elif any(indicator in content_lower for indicator in ["opinion", "editorial", "commentary"]):
-            self.content_type = ContentType.OPINION
-        elif any(indicator in content_lower for indicator in ["blog", "post", "author:"]):
-            self.content_type = ContentType.BLOG_POST
-        elif any(indicator in content_lower for indicator in ["news", "breaking", "reported", "announced"]):
-            self.content_type = ContentType.NEWS_ARTICLE
-        else:
-            self.content_type = ContentType.UNKNOWN
+        # One case-insensitive scan instead of a lowercased copy and up to 16 substring scans
+        best = len(_CONTENT_TYPE_BY_GROUP)
+        for match in _CONTENT_TYPE_RE.finditer(self.content):
+            best = min(best, match.lastindex - 1)
+            if best == 0:
+                break
+
+        self.content_type = _CONTENT_TYPE_BY_GROUP[best] if best < len(_CONTENT_TYPE_BY_GROUP) else ContentType.UNKNOWN
 
     def add_score(self, agent_name: str, score: Score) -> None:
         """
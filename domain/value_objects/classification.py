@@ -5,6 +5,7 @@ This module defines the Classification value object used to represent
 the final classification result for news articles.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -31,6 +32,20 @@ class QualityLevel(Enum):
     LOW = "low"
 
 
+# Lower score bound of each category above VERY_POOR, ascending; _CATEGORY_BY_BAND[i]
+# is the category for scores with exactly i bounds at or below them
+_CATEGORY_THRESHOLDS = (2.1, 3.1, 5.1, 6.6, 7.6, 8.6)
+_CATEGORY_BY_BAND = (
+    ClassificationCategory.VERY_POOR,
+    ClassificationCategory.POOR,
+    ClassificationCategory.FAIR,
+    ClassificationCategory.GOOD,
+    ClassificationCategory.VERY_GOOD,
+    ClassificationCategory.EXCELLENT,
+    ClassificationCategory.OUTSTANDING,
+)
+
+
 @dataclass(frozen=True)
 class Classification:
     """
@@ -91,7 +106,7 @@ class Classification:
         if not isinstance(self.final_score, (int, float)):
             raise ValueError("Final score must be numeric")
 
-        if self.final_score < 0.1 or self.final_score > 10.0:
+        if not 0.1 <= self.final_score <= 10.0:  # Also rejects NaN
             raise ValueError("Final score must be between 0.1 and 10.0")
 
         if not isinstance(self.confidence, (int, float)):
@@ -130,20 +145,7 @@ class Classification:
     @staticmethod
     def _score_to_category(score: float) -> ClassificationCategory:
         """Convert score to appropriate category"""
-        if score >= 8.6:
-            return ClassificationCategory.OUTSTANDING
-        elif score >= 7.6:
-            return ClassificationCategory.EXCELLENT
-        elif score >= 6.6:
-            return ClassificationCategory.VERY_GOOD
-        elif score >= 5.1:
-            return ClassificationCategory.GOOD
-        elif score >= 3.1:
-            return ClassificationCategory.FAIR
-        elif score >= 2.1:
-            return ClassificationCategory.POOR
-        else:
-            return ClassificationCategory.VERY_POOR
+        return _CATEGORY_BY_BAND[bisect_right(_CATEGORY_THRESHOLDS, score)]
 
     @staticmethod
     def _score_to_quality(score: float) -> QualityLevel:
@@ -3,6 +3,7 @@ Advanced Context Engineering System
 Implements context budgeting, zones, and optimization for AI agents
 """
 
+import functools
 import json
 import re
 from dataclasses import dataclass, field
@@ -11,6 +12,35 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import tiktoken
 
+# Patterns used per sentence / section, compiled once
+_NUMBER_RE = re.compile(r"\d+")
+_PROPER_NOUN_RE = re.compile(r"[A-Z][a-z]+")
+_ARTICLE_INDICATOR_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:published|posted|updated).*\d{4}",  # Dates
+        r"by\s+[A-Z][a-z]+\s+[A-Z][a-z]+",  # Author names
+        r"share\s+this\s+article",  # Social sharing
+        r"related\s+articles?",  # Related content
+        r"more\s+from\s+[A-Z]",  # More from author/category
+    )
+)
+_NAVIGATION_RE = re.compile(r"(menu|navigation|sidebar|footer|header)", re.IGNORECASE)
+_SOCIAL_RE = re.compile(r"(share|tweet|facebook|linkedin|subscribe)", re.IGNORECASE)
+_RELATED_RE = re.compile(r"related\s+articles?|more\s+stories", re.IGNORECASE)
+
+# Model the classifier agents call; token budgets are measured in its encoding
+TOKENIZER_MODEL = "gpt-4o-mini"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """tiktoken encoding for TOKENIZER_MODEL, resolved once per process"""
+    try:
+        return tiktoken.encoding_for_model(TOKENIZER_MODEL)
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
+
 
 class ContextZone(Enum):
     """Context zones for different types of content"""
@@ -52,8 +82,7 @@ class ContextElement:
     def _count_tokens(self, text: str) -> int:
         """Count tokens using tiktoken"""
         try:
-            encoding = tiktoken.encoding_for_model("gpt-4")
-            return len(encoding.encode(text))
+            return len(_get_encoding().encode(text))
         except Exception:
             # Fallback estimation
             return len(text.split()) * 1.3
@@ -106,10 +135,7 @@ class ContextEngine:
 
     def _get_encoding(self):
         """Get tiktoken encoding"""
-        try:
-            return tiktoken.encoding_for_model("gpt-4")
-        except Exception:
-            return tiktoken.get_encoding("cl100k_base")
+        return _get_encoding()
 
     def add_context_element(
         self,
@@ -219,8 +245,8 @@ class ContextEngine:
         scored_sentences = []
         for sentence in sentences:
             score = 0
-            score += len(re.findall(r"\d+", sentence)) * 2  # Numbers
-            score += len(re.findall(r"[A-Z][a-z]+", sentence))  # Proper nouns
+            score += len(_NUMBER_RE.findall(sentence)) * 2  # Numbers
+            score += len(_PROPER_NOUN_RE.findall(sentence))  # Proper nouns
             score += len(sentence.split())  # Length bonus
             scored_sentences.append((sentence, score))
 
@@ -341,34 +367,30 @@ class ContextEngine:
     def detect_context_bleed(self, content: str) -> Dict[str, Any]:
         """Detect potential context bleed in multi-article pages"""
         # Look for multiple article indicators
-        article_indicators = [
-            r"(?:published|posted|updated).*\d{4}",  # Dates
-            r"by\s+[A-Z][a-z]+\s+[A-Z][a-z]+",  # Author names
-            r"share\s+this\s+article",  # Social sharing
-            r"related\s+articles?",  # Related content
-            r"more\s+from\s+[A-Z]",  # More from author/category
-        ]
-
         indicator_matches = []
-        for pattern in article_indicators:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            indicator_matches.extend(matches)
+        for pattern in _ARTICLE_INDICATOR_RES:
+            indicator_matches.extend(pattern.findall(content))
 
         # Check for abrupt topic changes
         paragraphs = content.split("\n\n")
         topic_changes = 0
+        prev_words = None  # Word set of paragraphs[i - 1], carried over so each paragraph is split once
 
         for i in range(1, len(paragraphs)):
             if len(paragraphs[i]) > 50:  # Substantial paragraph
                 # Simple heuristic: check for topic discontinuity
-                prev_words = set(paragraphs[i - 1].lower().split())
+                if prev_words is None:
+                    prev_words = set(paragraphs[i - 1].lower().split())
                 curr_words = set(paragraphs[i].lower().split())
 
-                overlap = len(prev_words.intersection(curr_words))
-                union = len(prev_words.union(curr_words))
+                overlap = len(prev_words & curr_words)
+                union = len(prev_words) + len(curr_words) - overlap
 
                 if union > 0 and overlap / union < 0.1:  # Low overlap
                     topic_changes += 1
+                prev_words = curr_words
+            else:
+                prev_words = None
 
         bleed_score = len(indicator_matches) * 0.3 + topic_changes * 0.2
 
@@ -399,11 +421,11 @@ class ContextEngine:
                 continue
 
             # Check if this looks like article navigation or sidebar
-            if re.search(r"(menu|navigation|sidebar|footer|header)", section.lower()):
+            if _NAVIGATION_RE.search(section):
                 continue
 
             # Check for social media or sharing buttons
-            if re.search(r"(share|tweet|facebook|linkedin|subscribe)", section.lower()):
+            if _SOCIAL_RE.search(section):
                 continue
 
             # Start of main content detected
@@ -414,7 +436,7 @@ class ContextEngine:
                 main_content.append(section)
 
                 # Stop if we hit another article
-                if len(main_content) > 5 and re.search(r"related\s+articles?|more\s+stories", section.lower()):
+                if len(main_content) > 5 and _RELATED_RE.search(section):
                     break
 
         return "\n\n".join(main_content)
@@ -0,0 +1,93 @@
+"""
+Weight Kernels for Batch Weight Recommendations
+Numeric kernels for adjusting and normalizing many weight vectors at once
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+
+def pack_rules(adjustments: Tuple[Tuple[Tuple[int, float, float, float], ...], ...]) -> Tuple[np.ndarray, ...]:
+    """
+    Flatten per-flag adjustment rules into kernel arrays
+
+    ``adjustments[f]`` holds the (index, multiplier, lower, upper) rules applied
+    when flag column ``f`` is set. Rules keep their order, which matters when two
+    flags touch the same agent.
+    """
+    flags, indices, multipliers, lower, upper = [], [], [], [], []
+    for flag, rules in enumerate(adjustments):
+        for index, multiplier, low, high in rules:
+            flags.append(flag)
+            indices.append(index)
+            multipliers.append(multiplier)
+            lower.append(low)
+            upper.append(high)
+
+    return (
+        np.array(flags, dtype=np.int64),
+        np.array(indices, dtype=np.int64),
+        np.array(multipliers, dtype=np.float64),
+        np.array(lower, dtype=np.float64),
+        np.array(upper, dtype=np.float64),
+    )
+
+
+def _adjust_and_normalize_numpy(weights, flags, rule_flags, rule_indices, rule_multipliers, rule_lower, rule_upper):
+    """Broadcast fallback: one vectorized column update per rule, then row normalization"""
+    for r in range(rule_flags.shape[0]):
+        mask = flags[:, rule_flags[r]]
+        column = weights[:, rule_indices[r]]
+        adjusted = np.clip(column * rule_multipliers[r], rule_lower[r], rule_upper[r])
+        weights[:, rule_indices[r]] = np.where(mask, adjusted, column)
+
+    weights /= weights.sum(axis=1)[:, None]
+    return weights
+
+
+if numba_available:
+
+    # No fastmath: the clamp bounds include +/-inf, which nnan/ninf would make undefined
+    @njit(cache=True)
+    def _adjust_and_normalize_jit(weights, flags, rule_flags, rule_indices, rule_multipliers, rule_lower, rule_upper):
+        """Row-wise loop kernel compiled with numba"""
+        n_rows, n_agents = weights.shape
+        for n in range(n_rows):
+            for r in range(rule_flags.shape[0]):
+                if flags[n, rule_flags[r]]:
+                    i = rule_indices[r]
+                    value = weights[n, i] * rule_multipliers[r]
+                    if value < rule_lower[r]:
+                        value = rule_lower[r]
+                    elif value > rule_upper[r]:
+                        value = rule_upper[r]
+                    weights[n, i] = value
+
+            total = 0.0
+            for i in range(n_agents):
+                total += weights[n, i]
+            for i in range(n_agents):
+                weights[n, i] /= total
+        return weights
+
+    adjust_and_normalize = _adjust_and_normalize_jit
+else:
+    adjust_and_normalize = _adjust_and_normalize_numpy
+
+
+def warm_up(n_agents: int, rules: Tuple[np.ndarray, ...]):
+    """Trigger JIT compilation with a single-row batch"""
+    n_flags = int(rules[0].max()) + 1 if rules[0].size else 0
+    adjust_and_normalize(
+        np.full((1, n_agents), 1.0 / n_agents),
+        np.zeros((1, n_flags), dtype=np.bool_),
+        *rules,
+    )
@@ -3,15 +3,22 @@ Weight Matrix System for AI Agent Scoring
 Dynamic weight configuration and optimization for multi-agent classification
 """
 
+import functools
 import json
+import math
 import sqlite3
-from dataclasses import asdict, dataclass, field
+import struct
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import numpy as np
+if TYPE_CHECKING:
+    # numpy is imported lazily by the batch API; these names are only for annotations
+    import numpy as np
+    import numpy.typing as npt
 
 
 class ContentType(Enum):
@@ -37,7 +44,78 @@ class ScenarioType(Enum):
     CONSENSUS_BALANCED = "consensus_balanced"
 
 
-@dataclass
+# Fallback configuration names used by get_optimal_configuration
+_SCENARIO_FALLBACK: Dict[ScenarioType, str] = {
+    ScenarioType.FACT_HEAVY: "fact_heavy",
+    ScenarioType.DEPTH_FOCUSED: "depth_focused",
+    ScenarioType.HUMAN_CENTRIC: "human_centric",
+}
+_CONTENT_FALLBACK: Dict[ContentType, str] = {
+    ContentType.NEWS_ARTICLE: "news_optimized",
+    ContentType.TECHNICAL_DOC: "technical_optimized",
+}
+
+# Agent order used for the packed weight vector
+AGENT_NAMES: Tuple[str, ...] = (
+    "context_evaluator",
+    "fact_checker",
+    "depth_analyzer",
+    "relevance_analyzer",
+    "structure_analyzer",
+    "historical_reflection",
+    "human_reasoning",
+    "reflective_validator",
+)
+
+
+# Row format for the weights BLOB: the eight agent weights as little-endian doubles
+_WEIGHTS_STRUCT = struct.Struct(f"<{len(AGENT_NAMES)}d")
+
+_AGENT_INDEX: Dict[str, int] = {name: i for i, name in enumerate(AGENT_NAMES)}
+
+
+def _weight_adjustment(*rules: Tuple[str, float, float, float]) -> Tuple[Tuple[int, float, float, float], ...]:
+    """Resolve (agent, multiplier, lower, upper) rules to weight vector indices"""
+    return tuple((_AGENT_INDEX[agent], multiplier, lower, upper) for agent, multiplier, lower, upper in rules)
+
+
+# Content-analysis weight adjustments: scale, then clamp to [lower, upper]
+_TECHNICAL_ADJUSTMENT = _weight_adjustment(
+    ("depth_analyzer", 1.5, -math.inf, 0.25),
+    ("fact_checker", 1.2, -math.inf, 0.30),
+    ("human_reasoning", 0.7, 0.05, math.inf),
+)
+_CREDIBILITY_ADJUSTMENT = _weight_adjustment(
+    ("fact_checker", 1.8, -math.inf, 0.40),
+    ("context_evaluator", 1.4, -math.inf, 0.25),
+)
+_SHORT_CONTENT_ADJUSTMENT = _weight_adjustment(
+    ("structure_analyzer", 0.6, 0.05, math.inf),
+    ("human_reasoning", 1.3, -math.inf, 0.30),
+)
+
+
+# Adjustments in the column order of recommend_batch's analysis flags
+_ADJUSTMENTS_BY_FLAG = (_TECHNICAL_ADJUSTMENT, _CREDIBILITY_ADJUSTMENT, _SHORT_CONTENT_ADJUSTMENT)
+
+
+def _apply_adjustment(weights: List[float], adjustment: Tuple[Tuple[int, float, float, float], ...]) -> None:
+    """Apply a weight adjustment to a weight vector in place"""
+    for index, multiplier, lower, upper in adjustment:
+        weights[index] = min(upper, max(lower, weights[index] * multiplier))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_weight_kernels():
+    """Import the numpy/numba batch kernels on first use and compile them once"""
+    from infrastructure.ai_agents import weight_kernels
+
+    rules = weight_kernels.pack_rules(_ADJUSTMENTS_BY_FLAG)
+    weight_kernels.warm_up(len(AGENT_NAMES), rules)
+    return weight_kernels, rules
+
+
+@dataclass(frozen=True, slots=True)
 class WeightConfiguration:
     """Weight configuration for different agents"""
 
@@ -58,34 +136,33 @@ class WeightConfiguration:
     created_at: datetime = field(default_factory=datetime.now)
     performance_score: float = 0.0  # Track performance for optimization
 
+    # Agent weights packed in AGENT_NAMES order
+    _w: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, float]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        """Validate weights sum to 1.0"""
-        total = (
-            self.context_evaluator
-            + self.fact_checker
-            + self.depth_analyzer
-            + self.relevance_analyzer
-            + self.structure_analyzer
-            + self.historical_reflection
-            + self.human_reasoning
-            + self.reflective_validator
+        """Pack the weights into a vector and validate they sum to 1.0"""
+        weights = (
+            self.context_evaluator,
+            self.fact_checker,
+            self.depth_analyzer,
+            self.relevance_analyzer,
+            self.structure_analyzer,
+            self.historical_reflection,
+            self.human_reasoning,
+            self.reflective_validator,
         )
+        object.__setattr__(self, "_w", weights)
 
+        total = math.fsum(weights)
         if abs(total - 1.0) > 0.01:  # Allow small floating point errors
             raise ValueError(f"Weights must sum to 1.0, got {total}")
 
     def to_dict(self) -> Dict[str, float]:
-        """Convert to dictionary format"""
-        return {
-            "context_evaluator": self.context_evaluator,
-            "fact_checker": self.fact_checker,
-            "depth_analyzer": self.depth_analyzer,
-            "relevance_analyzer": self.relevance_analyzer,
-            "structure_analyzer": self.structure_analyzer,
-            "historical_reflection": self.historical_reflection,
-            "human_reasoning": self.human_reasoning,
-            "reflective_validator": self.reflective_validator,
-        }
+        """Convert to dictionary format (shared per instance; copy before mutating)"""
+        if self._dict_cache is None:
+            object.__setattr__(self, "_dict_cache", dict(zip(AGENT_NAMES, self._w)))
+        return self._dict_cache
 
 
 class WeightMatrix:
@@ -103,6 +180,11 @@ class WeightMatrix:
     def __init__(self, db_path: str = "infrastructure/ai_agents/weight_matrix.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Decoded configurations keyed by name; invalidated on save
+        self._config_cache: Dict[str, WeightConfiguration] = {}
+        self._config_cache_lock = threading.Lock()
+
         self._init_database()
         self._load_default_configurations()
 
@@ -122,11 +204,20 @@ class WeightMatrix:
                     performance_score REAL DEFAULT 0.0,
                     usage_count INTEGER DEFAULT 0,
                     created_at TEXT,
-                    last_used TEXT
+                    last_used TEXT,
+                    weights BLOB,
+                    description TEXT
                 )
             """
             )
 
+            # Databases created before weights were packed only have config_json
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(weight_configs)")}
+            if "weights" not in columns:
+                conn.execute("ALTER TABLE weight_configs ADD COLUMN weights BLOB")
+            if "description" not in columns:
+                conn.execute("ALTER TABLE weight_configs ADD COLUMN description TEXT")
+
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS performance_logs (
@@ -142,6 +233,34 @@ class WeightMatrix:
             """
             )
 
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_wc_ct_st_perf
+                ON weight_configs(content_type, scenario_type, performance_score DESC, usage_count DESC)
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_pl_cfg
+                ON performance_logs(config_name)
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_pl_ts
+                ON performance_logs(timestamp DESC)
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_perflog_ct_ts
+                ON performance_logs(content_type, timestamp DESC)
+            """
+            )
+
     def _load_default_configurations(self):
         """Load default weight configurations for different scenarios"""
         default_configs = {
@@ -219,62 +338,146 @@ class WeightMatrix:
             ),
         }
 
-        for config_name, config in default_configs.items():
-            self.save_configuration(config)
+        names = list(default_configs)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                f"SELECT COUNT(*) FROM weight_configs WHERE name IN ({', '.join('?' * len(names))})",
+                names,
+            )
+            if cursor.fetchone()[0] == len(names):
+                return  # Defaults already stored by a previous instance
+
+            # Single executemany so all defaults land in one transaction
+            now = datetime.now().isoformat()
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO weight_configs 
+                (name, config_json, content_type, scenario_type, 
+                 performance_score, created_at, last_used, weights, description)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                [self._config_row(config, now) for config in default_configs.values()],
+            )
+            conn.commit()
+
+            # Refresh planner statistics once the tables are populated
+            conn.execute("ANALYZE")
+
+        with self._config_cache_lock:
+            for name in names:
+                self._config_cache.pop(name, None)
+
+    @staticmethod
+    def _config_row(config: WeightConfiguration, last_used: str) -> Tuple:
+        """Build the weight_configs row values for a configuration"""
+        return (
+            config.name,
+            "",  # config_json is only read for rows written before weights were packed
+            config.content_type.value if config.content_type else None,
+            config.scenario_type.value,
+            config.performance_score,
+            config.created_at.isoformat(),
+            last_used,
+            _WEIGHTS_STRUCT.pack(*config._w),
+            config.description,
+        )
 
     def save_configuration(self, config: WeightConfiguration):
         """Save a weight configuration to database"""
+        with self._config_cache_lock:
+            self._config_cache.pop(config.name, None)
+
         with sqlite3.connect(self.db_path) as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO weight_configs 
                 (name, config_json, content_type, scenario_type, 
-                 performance_score, created_at, last_used)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                 performance_score, created_at, last_used, weights, description)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-                (
-                    config.name,
-                    json.dumps(asdict(config), default=str),
-                    config.content_type.value if config.content_type else None,
-                    config.scenario_type.value,
-                    config.performance_score,
-                    config.created_at.isoformat(),
-                    datetime.now().isoformat(),
-                ),
+                self._config_row(config, datetime.now().isoformat()),
             )
 
     def get_configuration(self, name: str) -> Optional[WeightConfiguration]:
         """Retrieve a weight configuration by name"""
+        with self._config_cache_lock:
+            config = self._config_cache.get(name)
+        if config is not None:
+            return config
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
-                SELECT config_json FROM weight_configs WHERE name = ?
+                SELECT weights, description, content_type, scenario_type,
+                       performance_score, created_at, config_json
+                FROM weight_configs WHERE name = ?
             """,
                 (name,),
             )
             row = cursor.fetchone()
 
+            if row and row[0] is None:
+                # Legacy JSON row: take the weights from config_json once and store them packed
+                legacy = self._decode_config(row[6])
+                row = (_WEIGHTS_STRUCT.pack(*legacy._w), legacy.description) + row[2:]
+                conn.execute(
+                    "UPDATE weight_configs SET weights = ?, description = ? WHERE name = ?",
+                    (row[0], row[1], name),
+                )
+
         if row:
-            config_data = json.loads(row[0])
-            # Handle datetime deserialization
-            if "created_at" in config_data and isinstance(config_data["created_at"], str):
-                config_data["created_at"] = datetime.fromisoformat(config_data["created_at"])
-
-            # Handle enum deserialization
-            if config_data.get("content_type"):
-                try:
-                    config_data["content_type"] = ContentType(config_data["content_type"])
-                except ValueError:
-                    config_data["content_type"] = None
-            if config_data.get("scenario_type"):
-                try:
-                    config_data["scenario_type"] = ScenarioType(config_data["scenario_type"])
-                except ValueError:
-                    config_data["scenario_type"] = ScenarioType.DEFAULT
-
-            return WeightConfiguration(**config_data)
+            config = self._decode_row(name, row)
+            with self._config_cache_lock:
+                self._config_cache[name] = config
+            return config
         return None
 
+    @staticmethod
+    def _decode_row(name: str, row: Tuple) -> WeightConfiguration:
+        """Rebuild a WeightConfiguration from its packed weight_configs row"""
+        weights, description, content_type, scenario_type, performance_score, created_at = row[:6]
+
+        try:
+            content_type = ContentType(content_type) if content_type else None
+        except ValueError:
+            content_type = None
+        try:
+            scenario_type = ScenarioType(scenario_type) if scenario_type else ScenarioType.DEFAULT
+        except ValueError:
+            scenario_type = ScenarioType.DEFAULT
+
+        return WeightConfiguration(
+            **dict(zip(AGENT_NAMES, _WEIGHTS_STRUCT.unpack(weights))),
+            name=name,
+            description=description or "",
+            content_type=content_type,
+            scenario_type=scenario_type,
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
+            performance_score=performance_score or 0.0,
+        )
+
+    @staticmethod
+    def _decode_config(config_json: str) -> WeightConfiguration:
+        """Rebuild a WeightConfiguration from its legacy stored JSON"""
+        config_data = json.loads(config_json)
+        # Handle datetime deserialization
+        if "created_at" in config_data and isinstance(config_data["created_at"], str):
+            config_data["created_at"] = datetime.fromisoformat(config_data["created_at"])
+
+        # Handle enum deserialization
+        if config_data.get("content_type"):
+            try:
+                config_data["content_type"] = ContentType(config_data["content_type"])
+            except ValueError:
+                config_data["content_type"] = None
+        if config_data.get("scenario_type"):
+            try:
+                config_data["scenario_type"] = ScenarioType(config_data["scenario_type"])
+            except ValueError:
+                config_data["scenario_type"] = ScenarioType.DEFAULT
+
+        return WeightConfiguration(**config_data)
+
     def get_optimal_configuration(
         self,
         content_type: Optional[ContentType] = None,
@@ -284,20 +487,19 @@ class WeightMatrix:
 
         # First, try to find exact match
         with sqlite3.connect(self.db_path) as conn:
-            query = "SELECT name, performance_score FROM weight_configs WHERE 1=1"
-            params = []
-
-            if content_type:
-                query += " AND content_type = ?"
-                params.append(content_type.value)
-
-            if scenario:
-                query += " AND scenario_type = ?"
-                params.append(scenario.value)
-
-            query += " ORDER BY performance_score DESC, usage_count DESC LIMIT 1"
-
-            cursor = conn.execute(query, params)
+            cursor = conn.execute(
+                """
+                SELECT name, performance_score FROM weight_configs
+                WHERE (:ct IS NULL OR content_type = :ct)
+                  AND (:sc IS NULL OR scenario_type = :sc)
+                ORDER BY performance_score DESC, usage_count DESC
+                LIMIT 1
+            """,
+                {
+                    "ct": content_type.value if content_type else None,
+                    "sc": scenario.value if scenario else None,
+                },
+            )
             row = cursor.fetchone()
 
         if row:
@@ -307,23 +509,14 @@ class WeightMatrix:
 
         # Fallback to scenario-based selection
         if scenario:
-            scenario_configs = {
-                ScenarioType.FACT_HEAVY: "fact_heavy",
-                ScenarioType.DEPTH_FOCUSED: "depth_focused",
-                ScenarioType.HUMAN_CENTRIC: "human_centric",
-            }
-            config_name = scenario_configs.get(scenario, "default")
+            config_name = _SCENARIO_FALLBACK.get(scenario, "default")
             config = self.get_configuration(config_name)
             if config:
                 return config
 
         # Fallback to content type specific
         if content_type:
-            type_configs = {
-                ContentType.NEWS_ARTICLE: "news_optimized",
-                ContentType.TECHNICAL_DOC: "technical_optimized",
-            }
-            config_name = type_configs.get(content_type, "default")
+            config_name = _CONTENT_FALLBACK.get(content_type, "default")
             config = self.get_configuration(config_name)
             if config:
                 return config
@@ -340,43 +533,69 @@ class WeightMatrix:
         metadata: Dict[str, Any] = None,
     ):
         """Log performance data for a configuration"""
-        score_difference = abs(human_score - ai_score)
+        self.log_performance_bulk([(config_name, human_score, ai_score, content_type, metadata)])
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO performance_logs 
-                (config_name, content_type, human_score, ai_score, 
-                 score_difference, timestamp, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+    def log_performance_bulk(
+        self,
+        entries: List[Tuple[str, float, float, Optional[ContentType], Optional[Dict[str, Any]]]],
+    ):
+        """Log many (config_name, human_score, ai_score, content_type, metadata) entries in one transaction"""
+        if not entries:
+            return
+
+        timestamp = datetime.now().isoformat()
+        log_rows = []
+        config_totals: Dict[str, List[float]] = {}  # name -> [score sum, count]
+
+        for config_name, human_score, ai_score, content_type, metadata in entries:
+            score_difference = abs(human_score - ai_score)
+            log_rows.append(
                 (
                     config_name,
                     content_type.value if content_type else None,
                     human_score,
                     ai_score,
                     score_difference,
-                    datetime.now().isoformat(),
+                    timestamp,
                     json.dumps(metadata or {}),
-                ),
+                )
             )
 
-            # Update configuration performance score
-            conn.execute(
+            totals = config_totals.setdefault(config_name, [0.0, 0])
+            totals[0] += 10.0 - score_difference
+            totals[1] += 1
+
+        with sqlite3.connect(self.db_path) as conn:
+            # Take the write lock up front so concurrent loggers queue instead of
+            # failing to upgrade a shared lock between the INSERT and the UPDATE
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                """
+                INSERT INTO performance_logs 
+                (config_name, content_type, human_score, ai_score, 
+                 score_difference, timestamp, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                log_rows,
+            )
+
+            # Fold each config's new samples into its running-mean performance score
+            conn.executemany(
                 """
                 UPDATE weight_configs 
-                SET performance_score = (
-                    SELECT AVG(10.0 - score_difference) 
-                    FROM performance_logs 
-                    WHERE config_name = ?
-                ),
-                usage_count = usage_count + 1,
+                SET performance_score = (performance_score * usage_count + ?) / (usage_count + ?),
+                usage_count = usage_count + ?,
                 last_used = ?
                 WHERE name = ?
             """,
-                (config_name, datetime.now().isoformat(), config_name),
+                [(total, count, count, timestamp, name) for name, (total, count) in config_totals.items()],
             )
 
+        # Cached configurations still carry the old performance_score
+        with self._config_cache_lock:
+            for name in config_totals:
+                self._config_cache.pop(name, None)
+
     def optimize_weights(
         self,
         target_content_type: Optional[ContentType] = None,
@@ -384,46 +603,34 @@ class WeightMatrix:
     ) -> WeightConfiguration:
         """Optimize weights based on performance history"""
 
-        # Get performance data
+        # Average score difference per configuration over the latest 100 logs
+        content_type_value = target_content_type.value if target_content_type else None
         with sqlite3.connect(self.db_path) as conn:
-            query = """
-                SELECT config_name, human_score, ai_score, score_difference
-                FROM performance_logs 
-                WHERE 1=1
-            """
-            params = []
-
-            if target_content_type:
-                query += " AND content_type = ?"
-                params.append(target_content_type.value)
-
-            query += " ORDER BY timestamp DESC LIMIT 100"
-
-            cursor = conn.execute(query, params)
-            performance_data = cursor.fetchall()
+            cursor = conn.execute(
+                """
+                SELECT config_name,
+                       AVG(score_difference) AS avg_difference,
+                       SUM(COUNT(*)) OVER () AS sample_size
+                FROM (
+                    SELECT config_name, score_difference
+                    FROM performance_logs
+                    WHERE (? IS NULL OR content_type = ?)
+                    ORDER BY timestamp DESC
+                    LIMIT 100
+                )
+                GROUP BY config_name
+                ORDER BY avg_difference ASC
+                LIMIT 1
+            """,
+                (content_type_value, content_type_value),
+            )
+            row = cursor.fetchone()
 
-        if len(performance_data) < 10:  # Need minimum data for optimization
+        if not row or row[2] < 10:  # Need minimum data for optimization
             return self.get_optimal_configuration(target_content_type)
 
-        # Analyze patterns in score differences
-        best_config = None
-        best_performance = float("inf")
-
-        config_performances = {}
-        for row in performance_data:
-            config_name = row[0]
-            score_diff = row[3]
-
-            if config_name not in config_performances:
-                config_performances[config_name] = []
-            config_performances[config_name].append(score_diff)
-
-        # Find best performing configuration
-        for config_name, diffs in config_performances.items():
-            avg_diff = np.mean(diffs)
-            if avg_diff < best_performance:
-                best_performance = avg_diff
-                best_config = config_name
+        # Best performing configuration has the lowest average difference
+        best_config, best_performance = row[0], row[1]
 
         if best_config:
             base_config = self.get_configuration(best_config)
@@ -453,30 +660,47 @@ class WeightMatrix:
         """Get weight recommendations based on content analysis"""
 
         # Base weights
-        weights = self.current_config.to_dict()
+        weights = list(self.current_config._w)
 
         # Adjust based on content characteristics
         if content_analysis.get("technical_complexity", "low") == "high":
             # Increase depth analyzer weight for technical content
-            weights["depth_analyzer"] = min(0.25, weights["depth_analyzer"] * 1.5)
-            weights["fact_checker"] = min(0.30, weights["fact_checker"] * 1.2)
-            weights["human_reasoning"] = max(0.05, weights["human_reasoning"] * 0.7)
+            _apply_adjustment(weights, _TECHNICAL_ADJUSTMENT)
 
         if content_analysis.get("credibility_concerns", False):
             # Increase fact checker weight for suspicious content
-            weights["fact_checker"] = min(0.40, weights["fact_checker"] * 1.8)
-            weights["context_evaluator"] = min(0.25, weights["context_evaluator"] * 1.4)
+            _apply_adjustment(weights, _CREDIBILITY_ADJUSTMENT)
 
         if content_analysis.get("content_length", 0) < 500:
             # Adjust for short content
-            weights["structure_analyzer"] = max(0.05, weights["structure_analyzer"] * 0.6)
-            weights["human_reasoning"] = min(0.30, weights["human_reasoning"] * 1.3)
+            _apply_adjustment(weights, _SHORT_CONTENT_ADJUSTMENT)
 
         # Normalize weights to sum to 1.0
-        total = sum(weights.values())
-        weights = {k: v / total for k, v in weights.items()}
+        total = sum(weights)
+
+        return {name: weight / total for name, weight in zip(AGENT_NAMES, weights)}
+
+    def recommend_batch(self, analysis_flags: "npt.ArrayLike", weights: Optional["npt.ArrayLike"] = None) -> "np.ndarray":
+        """
+        Batch form of get_weight_recommendations for large weight sweeps
+
+        analysis_flags is an (N, 3) boolean array with columns (high technical
+        complexity, credibility concerns, content shorter than 500 chars).
+        weights is an (N, 8) array in AGENT_NAMES order and defaults to the
+        current configuration. Returns the adjusted, normalized (N, 8) array.
+        Uses numba when installed and numpy broadcasting otherwise.
+        """
+        import numpy as np
+
+        weight_kernels, rules = _load_weight_kernels()
+
+        flags = np.asarray(analysis_flags, dtype=np.bool_).reshape(-1, len(_ADJUSTMENTS_BY_FLAG))
+        if weights is None:
+            weights = np.tile(np.array(self.current_config._w, dtype=np.float64), (flags.shape[0], 1))
+        else:
+            weights = np.array(weights, dtype=np.float64).reshape(flags.shape[0], len(AGENT_NAMES))
 
-        return weights
+        return weight_kernels.adjust_and_normalize(weights, flags, *rules)
 
     def set_current_configuration(self, config_name: str):
         """Set the current active configuration"""
@@ -563,10 +787,16 @@ class WeightMatrix:
         }
 
 
-# Global weight matrix instance
-weight_matrix = WeightMatrix()
+# Global weight matrix instance, created on first use
+_weight_matrix: Optional[WeightMatrix] = None
+_weight_matrix_lock = threading.Lock()
 
 
 def get_weight_matrix() -> WeightMatrix:
     """Get the global weight matrix instance"""
-    return weight_matrix
+    global _weight_matrix
+    if _weight_matrix is None:
+        with _weight_matrix_lock:
+            if _weight_matrix is None:
+                _weight_matrix = WeightMatrix()
+    return _weight_matrix
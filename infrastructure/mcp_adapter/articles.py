@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Article Records
+===============
+
+Lightweight article types passed between the adapter's fetch and classify
+paths. ArticleRecord is a slotted, immutable record for one article;
+ArticleBatch holds many articles column-wise (one list per field) for
+bulk work such as embedding every title in one call.
+
+Records are converted to dicts only at serialization boundaries (adapter
+results, the classifier's result merge).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+@dataclass(frozen=True, slots=True)
+class ArticleRecord:
+    """A fetched article awaiting classification."""
+
+    title: str
+    content: str
+    source: str
+    url: str = ""
+    published_date: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Article dict in the shape the classifier pipeline expects."""
+        return {
+            "title": self.title,
+            "content": self.content,
+            "source": self.source,
+            "url": self.url,
+            "published_date": self.published_date,
+        }
+
+    def to_feed_dict(self) -> Dict[str, Any]:
+        """Article dict in the shape returned by fetch_rss_feed."""
+        return {
+            "title": self.title,
+            "link": self.url,
+            "description": self.content,
+            "published": self.published_date,
+            "source": self.source,
+        }
+
+
+@dataclass(slots=True)
+class ArticleBatch:
+    """Column-wise (structure-of-arrays) storage for many articles."""
+
+    titles: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    sources: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+    published_dates: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_records(cls, records: Iterable[ArticleRecord]) -> "ArticleBatch":
+        """Build a batch from article records."""
+        batch = cls()
+        for record in records:
+            batch.append(record)
+        return batch
+
+    def append(self, record: ArticleRecord):
+        """Add one article to the batch."""
+        self.titles.append(record.title)
+        self.contents.append(record.content)
+        self.sources.append(record.source)
+        self.urls.append(record.url)
+        self.published_dates.append(record.published_date)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __iter__(self) -> Iterator[ArticleRecord]:
+        return map(ArticleRecord, self.titles, self.contents, self.sources, self.urls, self.published_dates)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client
+==================
+
+One process-wide httpx.AsyncClient for direct requests (RSS feeds, article
+scraping) made by the adapter and the extractors. RSS and scraping often hit
+the same hosts, so sharing the pool keeps their connections alive across
+calls instead of opening new ones per request or per instance.
+
+MCP calls keep their own base_url client (api_adapter.get_shared_async_client).
+
+Usage:
+    from infrastructure.mcp_adapter.http import shared_client
+
+    async with shared_client().stream("GET", url) as response:
+        ...
+"""
+
+import asyncio
+import atexit
+import functools
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SHARED_POOL_LIMITS = httpx.Limits(max_keepalive_connections=200, max_connections=400, keepalive_expiry=30.0)
+SHARED_TIMEOUTS = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+
+
+@functools.lru_cache(maxsize=None)
+def shared_client() -> httpx.AsyncClient:
+    """Get the process-wide client for direct requests, created on first use."""
+    # SSL verification off to match the extractor's requests for problematic sites
+    return httpx.AsyncClient(
+        http2=True, follow_redirects=True, verify=False, limits=SHARED_POOL_LIMITS, timeout=SHARED_TIMEOUTS
+    )
+
+
+async def close_shared_client():
+    """Close the shared client (call from application shutdown hooks)."""
+    if shared_client.cache_info().currsize:
+        await shared_client().aclose()
+        shared_client.cache_clear()
+
+
+@atexit.register
+def _close_at_exit():
+    """Close pooled connections at interpreter exit if the application did not."""
+    if not shared_client.cache_info().currsize or shared_client().is_closed:
+        return
+    try:
+        asyncio.run(close_shared_client())
+    except Exception as e:
+        logger.debug("Shared client not closed cleanly at exit: %s", e)
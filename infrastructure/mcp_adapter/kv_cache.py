@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Exact-Key Response Cache
+========================
+
+TTL cache for direct RSS and scraping responses, keyed by a 64-bit xxh3
+hash of the request. Entries live in an in-process cachetools.TTLCache
+and, when a directory is given, in a diskcache.Cache so that other
+processes (and later pipeline runs) can reuse them until they expire.
+
+Usage:
+    cache = TTLResponseCache(maxsize=4096, ttl=300)
+    key = cache.key(url)
+    if (hit := await cache.get(key)) is not None:
+        return hit
+    ...
+    await cache.set(key, result)
+"""
+
+import asyncio
+from typing import Any, Optional
+
+import diskcache
+import xxhash
+from cachetools import TTLCache
+
+
+class TTLResponseCache:
+    """Async-safe TTL cache with optional on-disk persistence."""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 300, directory: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of in-memory entries
+            ttl: Seconds an entry stays valid
+            directory: diskcache directory for cross-process reuse (None = memory only)
+        """
+        self.ttl = ttl
+        self._memory: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._disk = diskcache.Cache(directory) if directory else None
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def key(*parts: Any) -> int:
+        """Hash request parts into a 64-bit cache key."""
+        return xxhash.xxh3_64_intdigest("\x1f".join(str(part) for part in parts).encode("utf-8"))
+
+    async def get(self, key: int) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        async with self._lock:
+            value = self._memory.get(key)
+            if value is None and self._disk is not None:
+                value = self._disk.get(key)
+                if value is not None:
+                    self._memory[key] = value
+            return value
+
+    async def set(self, key: int, value: Any):
+        """Store a value under key."""
+        async with self._lock:
+            self._memory[key] = value
+            if self._disk is not None:
+                self._disk.set(key, value, expire=self.ttl)
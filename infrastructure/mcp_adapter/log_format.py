@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Structured Log Formatting
+=========================
+
+JSON-lines log output for high-throughput pipeline runs, serialized with
+orjson. The adapter modules only create loggers; applications choose the
+output format.
+
+Usage:
+    from infrastructure.mcp_adapter.log_format import configure_json_logging
+
+    configure_json_logging(logging.INFO)
+"""
+
+import logging
+
+import orjson
+
+
+class JSONFormatter(logging.Formatter):
+    """Format log records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+
+def configure_json_logging(level: int = logging.INFO):
+    """Send root logger output to stderr as JSON lines."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(JSONFormatter())
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(level)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+MCP Call Reliability
+====================
+
+Failure isolation for calls to the MCP server:
+
+- CircuitBreaker: after repeated server-side failures, stop calling the
+  server for a recovery period so callers fail over to direct APIs
+  immediately instead of waiting on timeouts.
+- Bulkhead: caps the number of in-flight MCP calls so a slow server
+  cannot absorb every task in the process.
+- is_retryable_error: which failures are worth retrying (timeouts, 5xx,
+  429). Client errors such as 400/401/403 never succeed on retry.
+- is_provider_error: which failures mean the provider itself is down
+  (transport errors, timeouts, 5xx, 429, open circuit) rather than one
+  request being bad.
+- ProviderHealth: rolling failure rate of one provider in a fallback
+  chain (MCP, direct APIs, stale cache), used to skip providers that are
+  currently down.
+
+Usage:
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+    bulkhead = Bulkhead(capacity=64)
+
+    if not breaker.allow_request():
+        raise CircuitOpenError("MCP server unavailable")
+    async with bulkhead:
+        ...
+"""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Optional, Tuple
+
+import httpx
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Whether a failed call may succeed if retried (timeouts, 5xx, 429)."""
+    if isinstance(error, httpx.TimeoutException):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def is_provider_error(error: BaseException) -> bool:
+    """Whether a failure reflects the provider being down rather than a bad request."""
+    return isinstance(error, (CircuitOpenError, httpx.TransportError)) or is_retryable_error(error)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    CLOSED: calls pass; failure_threshold consecutive failures open the circuit.
+    OPEN: calls are rejected until recovery_timeout seconds have passed.
+    HALF_OPEN: calls pass as trials; a success closes the circuit, a failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before allowing trial calls
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def allow_request(self) -> bool:
+        """Whether a call may be attempted now."""
+        return self.state is not CircuitState.OPEN
+
+    def record_success(self):
+        """Record a call that reached a responsive server."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self):
+        """Record a server-side failure (timeout, 5xx, 429)."""
+        self._failures += 1
+        if self.state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+class Bulkhead:
+    """Async context manager bounding the number of concurrent calls."""
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize the bulkhead.
+
+        Args:
+            capacity: Maximum number of calls in flight at once
+        """
+        self.capacity = capacity
+        self._semaphore = asyncio.BoundedSemaphore(capacity)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self.capacity - self._semaphore._value
+
+    async def __aenter__(self) -> "Bulkhead":
+        await self._semaphore.acquire()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self._semaphore.release()
+
+
+class ProviderHealth:
+    """
+    Rolling health of one provider in a fallback chain.
+
+    The provider is skipped while more than max_failure_rate of its calls in
+    the last window seconds failed, except for one probe call every
+    probe_interval seconds so a recovered provider is picked up again.
+    """
+
+    def __init__(
+        self, window: float = 60.0, max_failure_rate: float = 0.5, probe_interval: float = 30.0, max_samples: int = 100
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Seconds of history used for the failure rate
+            max_failure_rate: Failure rate above which the provider is skipped
+            probe_interval: Seconds between probe calls to a skipped provider
+            max_samples: Maximum outcomes kept (ring buffer size)
+        """
+        self.window = window
+        self.max_failure_rate = max_failure_rate
+        self.probe_interval = probe_interval
+        self._outcomes: Deque[Tuple[float, bool]] = deque(maxlen=max_samples)  # (monotonic time, failed)
+        self._last_probe = 0.0
+
+    @property
+    def failure_rate(self) -> float:
+        """Fraction of calls in the window that failed."""
+        cutoff = time.monotonic() - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+        if not self._outcomes:
+            return 0.0
+        return sum(failed for _, failed in self._outcomes) / len(self._outcomes)
+
+    def allow_request(self) -> bool:
+        """Whether the provider should be tried now."""
+        if self.failure_rate <= self.max_failure_rate:
+            return True
+        now = time.monotonic()
+        if now - self._last_probe >= self.probe_interval:
+            self._last_probe = now
+            return True
+        return False
+
+    def record(self, success: bool):
+        """Record the outcome of a call (success=False only for provider-level failures)."""
+        now = time.monotonic()
+        self._outcomes.append((now, not success))
+        if not success:
+            self._last_probe = now  # Next probe is due probe_interval after the latest failure
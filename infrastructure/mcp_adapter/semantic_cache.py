@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Semantic Response Cache
+=======================
+
+In-process cache for classification responses. Syndicated RSS articles
+often repeat near-verbatim across sources and polls, so a response stored
+for one article can be returned for any later query whose embedding is
+close enough (cosine similarity >= threshold) within the same source.
+
+Embeddings use sentence-transformers MiniLM and a FAISS inner-product
+index. When either library is missing the cache still works, matching
+identical queries only.
+
+Usage:
+    cache = SemanticCache(capacity=10_000, threshold=0.92)
+    hit = cache.get(query, source)
+    if hit is None:
+        result = await classify(...)
+        cache.put(query, source, result)
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+
+    semantic_search_available = True
+except ImportError:
+    semantic_search_available = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    """
+    LRU response cache with exact and embedding-similarity lookup.
+
+    Entries are scoped by source: a hit is only returned for a query from
+    the same source as the stored one.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10_000,
+        threshold: float = 0.92,
+        semantic: bool = True,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            capacity: Maximum number of stored responses (least recently used evicted)
+            threshold: Minimum cosine similarity for a semantic hit
+            semantic: Whether to match similar queries (False = identical queries only)
+            model_name: sentence-transformers model used for embeddings
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.semantic = semantic and semantic_search_available
+        self.model_name = model_name
+
+        # entry id -> (source, response), in LRU order
+        self._entries: "OrderedDict[int, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        # (source, query digest) -> entry id
+        self._exact: Dict[Tuple[str, str], int] = {}
+        self._keys: Dict[int, Tuple[str, str]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        self._model: Any = None
+        self._index: Any = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def _embed(self, query: str):
+        """Embed a query as a normalized float32 row vector."""
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+            self._index = faiss.IndexIDMap(faiss.IndexFlatIP(self._model.get_sentence_embedding_dimension()))
+        vector = self._model.encode([query], convert_to_numpy=True).astype(np.float32)
+        faiss.normalize_L2(vector)
+        return vector
+
+    @staticmethod
+    def _digest(query: str) -> str:
+        return hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, query: str, source: str = "") -> Optional[Dict[str, Any]]:
+        """Return a cached response for the query, or None on a miss."""
+        key = (source, self._digest(query))
+        with self._lock:
+            entry_id = self._exact.get(key)
+            if entry_id is None and self.semantic and self._index is not None and self._index.ntotal:
+                distances, ids = self._index.search(self._embed(query), min(8, self._index.ntotal))
+                for similarity, candidate in zip(distances[0], ids[0]):
+                    if similarity < self.threshold:
+                        break
+                    entry = self._entries.get(int(candidate))
+                    if entry and entry[0] == source:
+                        entry_id = int(candidate)
+                        break
+
+            if entry_id is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(entry_id)
+            self.hits += 1
+            return self._entries[entry_id][1]
+
+    def put(self, query: str, source: str, response: Dict[str, Any]):
+        """Store a response for the query."""
+        key = (source, self._digest(query))
+        with self._lock:
+            if key in self._exact:
+                entry_id = self._exact[key]
+                self._entries[entry_id] = (source, response)
+                self._entries.move_to_end(entry_id)
+                return
+
+            entry_id = self._next_id
+            self._next_id += 1
+            if self.semantic:
+                try:
+                    vector = self._embed(query)
+                    self._index.add_with_ids(vector, np.array([entry_id], dtype=np.int64))
+                except Exception as e:
+                    logger.warning("Semantic cache embedding failed, using exact matching only: %s", e)
+                    self.semantic = False
+
+            self._entries[entry_id] = (source, response)
+            self._exact[key] = entry_id
+            self._keys[entry_id] = key
+
+            while len(self._entries) > self.capacity:
+                evicted_id, _ = self._entries.popitem(last=False)
+                del self._exact[self._keys.pop(evicted_id)]
+                if self.semantic:
+                    self._index.remove_ids(np.array([evicted_id], dtype=np.int64))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "semantic": self.semantic,
+        }
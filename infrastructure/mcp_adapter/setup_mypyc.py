@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Compile MCP Adapter Helpers with mypyc
+======================================
+
+Builds C extensions for the adapter's per-call helpers: the circuit
+breaker, bulkhead and provider health (reliability), article records
+(articles) and the response cache (kv_cache). The compiled .so files sit
+next to the .py sources and take precedence on import; delete them to go
+back to the pure-Python modules.
+
+api_adapter.py itself stays interpreted: mypyc does not support async
+generators (_direct_fetch_rss_iter) and compiles its lazy cached_property
+clients as plain properties.
+
+Usage (from anywhere):
+    python infrastructure/mcp_adapter/setup_mypyc.py build_ext --inplace
+"""
+
+import os
+
+from mypyc.build import mypycify
+from setuptools import setup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+COMPILED_MODULES = [
+    "infrastructure/mcp_adapter/reliability.py",
+    "infrastructure/mcp_adapter/articles.py",
+    "infrastructure/mcp_adapter/kv_cache.py",
+]
+
+if __name__ == "__main__":
+    # Module names come from paths relative to the repository root
+    os.chdir(ROOT)
+    setup(
+        name="mcp-adapter-compiled",
+        packages=[],
+        package_dir={"": "."},
+        ext_modules=mypycify(COMPILED_MODULES + ["--ignore-missing-imports", "--follow-imports=silent"]),
+    )
@@ -1,4 +1,6 @@
+import argparse
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -6,7 +8,7 @@ import random
 import sys
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 # Load environment variables
 try:
@@ -16,13 +18,16 @@ try:
 except ImportError:
     print("⚠️ python-dotenv not installed, using system environment variables")
 
+import httpx
+import numpy as np
 from langchain.schema import BaseMessage
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_ollama import ChatOllama
 
 # LangChain imports
-from langchain_openai import ChatOpenAI
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from pydantic import BaseModel, Field
 
 # Local imports
 from assistant.prompts import (
@@ -40,6 +45,21 @@ from assistant.prompts import (
     summary_instructions,
     validator_instructions,
 )
+from infrastructure.mcp_adapter.kv_cache import TTLResponseCache
+
+try:
+    import h2  # noqa: F401
+
+    http2_available = True
+except ImportError:
+    http2_available = False
+
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:
+    orjson_available = False
 
 # Try to import memory agents
 try:
@@ -57,6 +77,160 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_openai_llm(api_key: str) -> ChatOpenAI:
+    """
+    ChatOpenAI client shared by every NewsClassifierAgents instance.
+
+    All agents of all instances go through one pooled (HTTP/2 when h2 is
+    installed) connection set instead of each instance opening its own.
+    A stalled request is abandoned after LLM_TIMEOUT seconds and retried.
+    """
+    http_client = httpx.AsyncClient(
+        http2=http2_available,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+    )
+    return ChatOpenAI(
+        model="gpt-4o-mini",
+        temperature=0.3,
+        api_key=api_key,
+        timeout=float(os.getenv("LLM_TIMEOUT", "30")),
+        max_retries=2,
+        http_async_client=http_client,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_ollama_llms() -> Tuple[ChatOllama, ChatOllama]:
+    """Ollama chat and JSON-mode clients shared by every NewsClassifierAgents instance."""
+    return (
+        ChatOllama(model="llama3.2:latest", temperature=0.3),
+        ChatOllama(model="llama3.2:latest", temperature=0.3, format="json"),
+    )
+
+
+class FusedAnalysisScores(BaseModel):
+    """Phase-1 agent scores returned by a single fused completion."""
+
+    summary_score: float = Field(..., ge=1.0, le=10.0, description="summary_agent quality score")
+    preprocessor_score: float = Field(..., ge=1.0, le=10.0, description="input_preprocessor score")
+    context_score: float = Field(..., ge=1.0, le=10.0, description="context_evaluator score")
+    credibility_score: float = Field(..., ge=1.0, le=10.0, description="fact_checker credibility score")
+    depth_score: float = Field(..., ge=1.0, le=10.0, description="depth_analyzer score")
+    relevance_score: float = Field(..., ge=1.0, le=10.0, description="relevance_analyzer score")
+    structure_score: float = Field(..., ge=1.0, le=10.0, description="structure_analyzer score")
+    historical_score: float = Field(..., ge=1.0, le=10.0, description="historical_reflection score")
+    summary: str = Field("", description="Two or three sentence summary of the article")
+
+
+# Phase-1 agent -> its field in FusedAnalysisScores
+FUSED_ANALYSIS_FIELDS = {
+    "summary_agent": "summary_score",
+    "input_preprocessor": "preprocessor_score",
+    "context_evaluator": "context_score",
+    "fact_checker": "credibility_score",
+    "depth_analyzer": "depth_score",
+    "relevance_analyzer": "relevance_score",
+    "structure_analyzer": "structure_score",
+    "historical_reflection": "historical_score",
+}
+
+
+# Score field each agent's rubric asks for
+SCORE_FIELDS = {
+    "context_evaluator": "context_score",
+    "fact_checker": "credibility_score",
+    "depth_analyzer": "depth_score",
+    "relevance_analyzer": "relevance_score",
+    "structure_analyzer": "structure_score",
+    "historical_reflection": "historical_score",
+    "reflective_validator": "reflective_score",
+    "human_reasoning": "human_score",
+    "validator": "final_score",
+    "summary_agent": "summary_score",
+    "input_preprocessor": "preprocessor_score",
+    "score_consolidator": "consolidation_score",
+    "consensus_agent": "consensus_score",
+}
+
+# Score used when an agent's response has no valid score
+FALLBACK_SCORES = {
+    "context_evaluator": 6.0,
+    "fact_checker": 7.0,
+    "depth_analyzer": 5.5,
+    "relevance_analyzer": 6.5,
+    "structure_analyzer": 6.0,
+    "historical_reflection": 6.0,
+    "reflective_validator": 6.5,
+    "human_reasoning": 7.0,
+    "validator": 6.0,
+    "summary_agent": 6.5,
+    "input_preprocessor": 6.0,
+    "score_consolidator": 6.0,
+    "consensus_agent": 6.0,
+}
+
+
+def _dumps_indented(obj: Any) -> str:
+    """JSON text indented by two spaces for agent prompts (orjson when installed; non-ASCII kept as-is)"""
+    if orjson_available:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _random_fallback_score() -> float:
+    """Placeholder score in [4.0, 8.0] for an agent whose call failed (the same draw as random.uniform)"""
+    return round(4.0 + 4.0 * random.random(), 1)
+
+
+async def process_articles_shortest_first(
+    articles: List[Dict[str, Any]],
+    process: Callable[[int, Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run process(index, article) for every article concurrently, returning results in input order
+
+    Articles are started shortest first so long ones do not hold up the rest of the batch.
+
+    Args:
+        articles: Article dicts
+        process: Coroutine function called with the article's input index and the article
+        concurrency: Articles in flight at once (default: AGENT_BATCH_CONCURRENCY env var, 8)
+    """
+    if concurrency is None:
+        concurrency = int(os.getenv("AGENT_BATCH_CONCURRENCY", "8"))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def process_one(i: int) -> Dict[str, Any]:
+        async with semaphore:
+            return await process(i, articles[i])
+
+    order = sorted(
+        range(len(articles)),
+        key=lambda i: len(articles[i].get("content") or "") + len(articles[i].get("description") or ""),
+    )
+    tasks = {i: asyncio.create_task(process_one(i)) for i in order}
+    await asyncio.gather(*tasks.values())
+    return [tasks[i].result() for i in range(len(articles))]
+
+
+# Text sent to the relevance pre-filter is cut to stay under the embedding model's input limit
+MAX_EMBEDDING_CHARS = 8_000
+
+# Agents in the final weighted score and the result key of each weighted term
+WEIGHTED_SCORE_KEYS = (
+    ("context_evaluator", "context_score"),
+    ("fact_checker", "credibility_score"),
+    ("depth_analyzer", "depth_score"),
+    ("relevance_analyzer", "relevance_score"),
+    ("structure_analyzer", "structure_score"),
+    ("historical_reflection", "historical_score"),
+    ("reflective_validator", "reflective_score"),
+    ("human_reasoning", "human_reasoning_score"),
+)
+
+
 @dataclass
 class AgentResponse:
     agent_name: str
@@ -66,18 +240,67 @@ class AgentResponse:
 
 
 class NewsClassifierAgents:
-    def __init__(self):
-        """Initialize the News Classifier with enhanced agents"""
+    def __init__(
+        self,
+        fuse_analysis_agents: Optional[bool] = None,
+        min_article_words: Optional[int] = None,
+        relevance_centroid_path: Optional[str] = None,
+        min_relevance: Optional[float] = None,
+        response_cache_dir: Optional[str] = None,
+    ):
+        """
+        Initialize the News Classifier with enhanced agents
+
+        Args:
+            fuse_analysis_agents: Score all phase-1 agents in one structured completion
+                instead of one call per agent (default: FUSE_ANALYSIS_AGENTS env var)
+            min_article_words: Articles whose description and content have fewer words
+                are skipped without calling any agent (default: MIN_ARTICLE_WORDS env var, 1)
+            relevance_centroid_path: .npy embedding centroid of relevant news; when set (and
+                OpenAI is used), articles are embedded first and off-topic ones skipped
+                (default: NEWS_CENTROID_PATH env var, unset = no pre-filter)
+            min_relevance: Cosine similarity to the centroid below which an article is skipped
+                (default: NEWS_RELEVANCE_THRESHOLD env var, 0.25)
+            response_cache_dir: diskcache directory so agent responses are reused across runs
+                (default: AGENT_CACHE_DIR env var, unset = memory only)
+        """
+        if fuse_analysis_agents is None:
+            fuse_analysis_agents = os.getenv("FUSE_ANALYSIS_AGENTS", "false").lower() == "true"
+        self.fuse_analysis_agents = fuse_analysis_agents
+        if min_article_words is None:
+            min_article_words = int(os.getenv("MIN_ARTICLE_WORDS", "1"))
+        self.min_article_words = min_article_words
 
         # Initialize LLM
         openai_api_key = os.getenv("OPENAI_API_KEY")
         if openai_api_key:
-            self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3, api_key=openai_api_key)
+            self.llm = _shared_openai_llm(openai_api_key)
+            # JSON mode: the API only returns syntactically valid JSON objects
+            self.json_llm = self.llm.bind(response_format={"type": "json_object"})
             print("🤖 Using OpenAI GPT-4o-mini for detailed analysis")
         else:
-            self.llm = ChatOllama(model="llama3.2:latest", temperature=0.3)
+            self.llm, self.json_llm = _shared_ollama_llms()
             print("🤖 Using Ollama Llama3.2 for detailed analysis")
 
+        # Optional relevance pre-filter: one embedding call decides whether the agents run at all
+        self.embeddings = None
+        self.relevance_centroid = None
+        self.min_relevance = (
+            min_relevance if min_relevance is not None else float(os.getenv("NEWS_RELEVANCE_THRESHOLD", "0.25"))
+        )
+        relevance_centroid_path = relevance_centroid_path or os.getenv("NEWS_CENTROID_PATH")
+        if relevance_centroid_path and openai_api_key:
+            try:
+                centroid = np.load(relevance_centroid_path).astype(np.float32).ravel()
+                self.relevance_centroid = centroid / np.linalg.norm(centroid)
+                self.embeddings = OpenAIEmbeddings(
+                    model="text-embedding-3-small", api_key=openai_api_key, http_async_client=self.llm.http_async_client
+                )
+                print(f"🧭 Relevance pre-filter enabled (threshold {self.min_relevance})")
+            except Exception as e:
+                print(f"⚠️ Relevance pre-filter disabled: {e}")
+                self.relevance_centroid = None
+
         # Initialize Memory Agents if available
         if memory_agents_available:
             try:
@@ -92,6 +315,16 @@ class NewsClassifierAgents:
             self.memory_agent = None
             self.context_engine = None
 
+        # Agent responses by exact prompt, scoped per agent: re-runs of the same
+        # article skip the LLM round trip until the entry expires (AGENT_CACHE_TTL
+        # seconds). Identical prompts already in flight share one call.
+        self.response_cache = TTLResponseCache(
+            maxsize=2_048,
+            ttl=float(os.getenv("AGENT_CACHE_TTL", "3600")),
+            directory=response_cache_dir or os.getenv("AGENT_CACHE_DIR"),
+        )
+        self._pending_calls: Dict[int, asyncio.Future] = {}
+
         # Initialize JSON parser
         self.json_parser = JsonOutputParser()
 
@@ -100,70 +333,88 @@ class NewsClassifierAgents:
             "summary_agent": {
                 "instructions": summary_instructions,
                 "weight": 0.05,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "input_preprocessor": {
                 "instructions": input_preprocessor_instructions,
                 "weight": 0.05,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "context_evaluator": {
                 "instructions": context_evaluator_instructions,
                 "weight": 0.15,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "fact_checker": {
                 "instructions": fact_checker_instructions,
                 "weight": 0.20,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "depth_analyzer": {
                 "instructions": depth_analyzer_instructions,
                 "weight": 0.10,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "relevance_analyzer": {
                 "instructions": relevance_analyzer_instructions,
                 "weight": 0.10,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "structure_analyzer": {
                 "instructions": structure_analyzer_instructions,
                 "weight": 0.10,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "historical_reflection": {
                 "instructions": historical_reflection_instructions,
                 "weight": 0.05,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "reflective_validator": {
                 "instructions": reflective_validator_instructions,
                 "weight": 0.10,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "human_reasoning": {
                 "instructions": human_reasoning_instructions,
                 "weight": 0.20,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "score_consolidator": {
                 "instructions": consolidation_instructions,
                 "weight": 0.05,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "consensus_agent": {
                 "instructions": consensus_instructions,
                 "weight": 0.05,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
             "validator": {
                 "instructions": validator_instructions,
                 "weight": 0.15,
-                "fallback_score": lambda: round(random.uniform(4.0, 8.0), 1),
+                "fallback_score": _random_fallback_score,
             },
         }
 
+        # Weight vector aligned with WEIGHTED_SCORE_KEYS
+        self.score_weights = np.array([self.agent_configs[agent_name]["weight"] for agent_name, _ in WEIGHTED_SCORE_KEYS])
+
+        # JSON mode requires the word "JSON" in the prompt, which not every rubric contains
+        for config in self.agent_configs.values():
+            config["system_prompt"] = f"{config['instructions']}\n\nRespond with a single JSON object."
+
+        # Composite rubric for the fused phase-1 call: every analysis agent's instructions in one prompt
+        self.fused_analysis_instructions = (
+            "You perform the work of several analysis agents in a single pass. Each section below is one "
+            "agent's rubric; apply all of them to the article, ignore their individual output formats and "
+            "return only the requested structured fields, one score (1.0-10.0) per agent.\n\n"
+            + "\n\n".join(
+                f"### {agent_name} ({field})\n{self.agent_configs[agent_name]['instructions']}"
+                for agent_name, field in FUSED_ANALYSIS_FIELDS.items()
+            )
+        )
+
         print(f"🔧 Initialized {len(self.agent_configs)} enhanced agents")
 
     async def call_agent(self, agent_name: str, content: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -180,26 +431,21 @@ class NewsClassifierAgents:
             # Prepare context if available
             context_info = ""
             if context:
-                context_info = f"\n\nContext Information:\n{json.dumps(context, indent=2)}"
-
-            # Create messages
-            messages = [
-                SystemMessage(content=agent_config["instructions"]),
-                HumanMessage(content=f"{content}{context_info}"),
-            ]
-
-            # Call LLM
-            response = await self.llm.ainvoke(messages)
-
-            # Parse response
-            try:
-                parsed_response = json.loads(response.content)
-            except json.JSONDecodeError:
-                # Fallback parsing for non-JSON responses
-                parsed_response = {
-                    f"{agent_name}_state": response.content,
-                    "fallback_used": True,
-                }
+                context_info = f"\n\nContext Information:\n{_dumps_indented(context)}"
+
+            prompt = f"{content}{context_info}"
+            cache_key = self.response_cache.key(agent_name, prompt)
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Cache hit for {agent_name}")
+                return cached
+
+            pending = self._pending_calls.get(cache_key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._invoke_agent(agent_name, agent_config, prompt, cache_key))
+                self._pending_calls[cache_key] = pending
+                pending.add_done_callback(lambda _: self._pending_calls.pop(cache_key, None))
+            parsed_response = await asyncio.shield(pending)
 
             # Calculate processing time
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -232,67 +478,116 @@ class NewsClassifierAgents:
                 }
             }
 
-    def extract_score_from_response(self, response: Dict[str, Any], agent_name: str) -> float:
-        """Extract score from agent response with enhanced accuracy"""
+    async def _invoke_agent(self, agent_name: str, agent_config: Dict[str, Any], prompt: str, cache_key: int) -> Any:
+        """Run one agent prompt through the LLM and cache the parsed response"""
+        # Create messages
+        messages = [
+            SystemMessage(content=agent_config["system_prompt"]),
+            HumanMessage(content=prompt),
+        ]
 
-        # Score field mappings for different agents
-        score_mappings = {
-            "context_evaluator": "context_score",
-            "fact_checker": "credibility_score",
-            "depth_analyzer": "depth_score",
-            "relevance_analyzer": "relevance_score",
-            "structure_analyzer": "structure_score",
-            "historical_reflection": "historical_score",
-            "reflective_validator": "reflective_score",
-            "human_reasoning": "human_score",
-            "validator": "final_score",
-            "summary_agent": "summary_score",
-            "input_preprocessor": "preprocessor_score",
-            "score_consolidator": "consolidation_score",
-            "consensus_agent": "consensus_score",
+        # Call LLM
+        response = await self.json_llm.ainvoke(messages)
+
+        # Parse response
+        parsed_response = self.parse_response(response.content)
+        if parsed_response is None:
+            # Fallback parsing for non-JSON responses
+            return {
+                f"{agent_name}_state": response.content,
+                "fallback_used": True,
+            }
+
+        if isinstance(parsed_response, dict) and not parsed_response.get("fallback_used"):
+            await self.response_cache.set(cache_key, parsed_response)
+        return parsed_response
+
+    def parse_response(self, text: str) -> Optional[Any]:
+        """
+        Parse an agent's JSON response once.
+
+        Plain JSON goes through orjson (json without it); responses wrapped in
+        markdown code fences go through the langchain JSON parser. Returns None
+        if the text is not JSON.
+        """
+        try:
+            return orjson.loads(text) if orjson_available else json.loads(text)
+        except ValueError:
+            pass
+        try:
+            return self.json_parser.parse(text)
+        except Exception:
+            return None
+
+    async def call_fused_analysis(self, content: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Score every phase-1 agent with one structured-output completion.
+
+        Returns per-agent results shaped like call_agent responses, or None if
+        the call failed (callers then run the agents individually).
+        """
+        cache_key = self.response_cache.key("fused_analysis", content)
+        cached = await self.response_cache.get(cache_key)
+        if cached is None:
+            try:
+                structured_llm = self.llm.with_structured_output(FusedAnalysisScores)
+                scores = await structured_llm.ainvoke(
+                    [
+                        SystemMessage(content=self.fused_analysis_instructions),
+                        HumanMessage(content=content),
+                    ]
+                )
+                cached = scores.model_dump()
+            except Exception as e:
+                logger.warning(f"Fused analysis failed, falling back to individual agents: {e}")
+                return None
+            await self.response_cache.set(cache_key, cached)
+
+        return {
+            agent_name: {field: cached[field], "summary": cached["summary"], "fused": True}
+            for agent_name, field in FUSED_ANALYSIS_FIELDS.items()
         }
 
+    def extract_score_from_response(self, response: Dict[str, Any], agent_name: str) -> float:
+        """Extract score from agent response with enhanced accuracy"""
+
         # Get expected score field
-        expected_score_field = score_mappings.get(agent_name, f"{agent_name}_score")
+        expected_score_field = SCORE_FIELDS.get(agent_name, f"{agent_name}_score")
 
         # Debug logging
         logger.debug(f"Extracting score for {agent_name}, looking for field: {expected_score_field}")
         logger.debug(f"Response keys: {list(response.keys())}")
 
-        # Try multiple extraction strategies in order of preference
+        # Try multiple extraction strategies in order of preference: the first key present wins
         score = None
         extraction_method = "unknown"
 
-        # Strategy 1: Direct score field (most common)
-        if expected_score_field in response:
-            score = response[expected_score_field]
-            extraction_method = "direct_field"
-
-        # Strategy 2: Alternative score field names
-        elif f"{agent_name}_score" in response:
-            score = response[f"{agent_name}_score"]
-            extraction_method = "agent_score_field"
-
-        # Strategy 3: Look for common score field names
-        elif "score" in response:
-            score = response["score"]
-            extraction_method = "generic_score_field"
-
-        # Strategy 4: Look for nested state (legacy support)
-        elif f"{agent_name}_state" in response:
-            state = response[f"{agent_name}_state"]
+        # Top-level fields: direct score field (most common), agent score field, generic score field
+        top_level_keys = (
+            ("direct_field", expected_score_field),
+            ("agent_score_field", f"{agent_name}_score"),
+            ("generic_score_field", "score"),
+        )
+        # Nested state (legacy support)
+        nested_keys = (("nested_state", expected_score_field), ("nested_generic_score", "score"))
+
+        for method, key in top_level_keys:
+            if key in response:
+                score, extraction_method = response[key], method
+                break
+        else:
+            state = response.get(f"{agent_name}_state")
             if isinstance(state, dict):
-                if expected_score_field in state:
-                    score = state[expected_score_field]
-                    extraction_method = "nested_state"
-                elif "score" in state:
-                    score = state["score"]
-                    extraction_method = "nested_generic_score"
-
-        # Strategy 5: Search all fields for numeric values that could be scores
+                for method, key in nested_keys:
+                    if key in state:
+                        score, extraction_method = state[key], method
+                        break
+
+        # Last resort: search all fields for numeric values that could be scores
+        # (parsed JSON, so exact int/float types; a true flag is not a score of 1)
         if score is None:
             for key, value in response.items():
-                if "score" in key.lower() and isinstance(value, (int, float)):
+                if type(value) in (int, float) and "score" in key.lower():
                     if 1.0 <= float(value) <= 10.0:
                         score = value
                         extraction_method = f"found_in_{key}"
@@ -313,34 +608,70 @@ class NewsClassifierAgents:
 
         # Only use fallback if absolutely necessary
         logger.warning(f"⚠️ {agent_name}: No valid score found in response, using fallback")
-        logger.debug(f"Full response for debugging: {json.dumps(response, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Full response for debugging: {json.dumps(response, indent=2)}")
 
         # Use a more reasonable fallback based on agent type
-        fallback_scores = {
-            "context_evaluator": 6.0,
-            "fact_checker": 7.0,
-            "depth_analyzer": 5.5,
-            "relevance_analyzer": 6.5,
-            "structure_analyzer": 6.0,
-            "historical_reflection": 6.0,
-            "reflective_validator": 6.5,
-            "human_reasoning": 7.0,
-            "validator": 6.0,
-            "summary_agent": 6.5,
-            "input_preprocessor": 6.0,
-            "score_consolidator": 6.0,
-            "consensus_agent": 6.0,
-        }
-
-        fallback_score = fallback_scores.get(agent_name, 6.0)
+        fallback_score = FALLBACK_SCORES.get(agent_name, 6.0)
         logger.warning(f"Using fallback score {fallback_score} for {agent_name}")
         return fallback_score
 
-    async def process_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
-        """Process article through all agents with enhanced scoring"""
+    async def relevance_similarity(self, text: str) -> Optional[float]:
+        """Cosine similarity of the text's embedding to the relevance centroid (None if unavailable)"""
+        try:
+            embedding = np.asarray(await self.embeddings.aembed_query(text[:MAX_EMBEDDING_CHARS]), dtype=np.float32)
+            return float(embedding @ self.relevance_centroid / np.linalg.norm(embedding))
+        except Exception as e:
+            logger.warning(f"Relevance pre-filter failed, analyzing anyway: {e}")
+            return None
+
+    def skipped_result(self, article: Dict[str, Any], reason: str) -> Dict[str, Any]:
+        """Result for an article that was not sent to the agents (same shape as a processed one)"""
+        logger.info(f"Skipping {article.get('title', 'Unknown')[:50]}: {reason}")
+        return {
+            **article,
+            "skipped": True,
+            "skip_reason": reason,
+            "ai_responses": {},
+            "processing_timestamp": datetime.now().isoformat(),
+            "agent_count": 0,
+            "agent_scores": {
+                "context_score": 0,
+                "credibility_score": 0,
+                "depth_score": 0,
+                "relevance_score": 0,
+                "structure_score": 0,
+                "historical_score": 0,
+                "reflective_score": 0,
+                "human_reasoning_score": 0,
+                "validator_score": 0,
+                "overall_score": 0,
+            },
+            "weighted_scores": {},
+            "final_weighted_score": 0.0,
+            "weight_configuration": "enhanced_v2",
+        }
+
+    async def process_article(self, article: Union[Dict[str, Any], Any]) -> Dict[str, Any]:
+        """Process article (dict or ArticleRecord) through all agents with enhanced scoring"""
+
+        if not isinstance(article, dict):
+            article = article.to_dict()
 
         print(f"🔄 Processing: {article.get('title', 'Unknown')[:50]}...")
 
+        # Skip articles with no body to analyze before paying for any agent call
+        body_words = len(f"{article.get('description') or ''} {article.get('content') or ''}".split())
+        if body_words < self.min_article_words:
+            return self.skipped_result(article, f"Content too short ({body_words} words)")
+
+        if self.relevance_centroid is not None:
+            similarity = await self.relevance_similarity(
+                f"{article.get('title') or ''}\n{article.get('description') or ''}\n{article.get('content') or ''}"
+            )
+            if similarity is not None and similarity < self.min_relevance:
+                return self.skipped_result(article, f"Low relevance to news centroid ({similarity:.2f})")
+
         # Prepare content for analysis
         content = f"""
         Title: {article.get('title', '')}
@@ -368,33 +699,34 @@ class NewsClassifierAgents:
         print("📊 Phase 1: Individual agent analysis...")
         individual_results = {}
 
-        # Process individual agents in parallel
-        tasks = []
-        for agent_name in individual_agents:
-            task = self.call_agent(agent_name, content)
-            tasks.append((agent_name, task))
+        fused_results = await self.call_fused_analysis(content) if self.fuse_analysis_agents else None
+        if fused_results is not None:
+            individual_results.update(fused_results)
+            individual_agents = []
 
-        # Wait for all individual agents to complete
-        for agent_name, task in tasks:
-            try:
-                result = await task
-                individual_results[agent_name] = result
-            except Exception as e:
-                logger.error(f"Error in {agent_name}: {e}")
+        # Process individual agents in parallel; they only read the article content
+        results = await asyncio.gather(
+            *(self.call_agent(agent_name, content) for agent_name in individual_agents),
+            return_exceptions=True,
+        )
+
+        for agent_name, result in zip(individual_agents, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error in {agent_name}: {result}")
                 fallback_score = self.agent_configs[agent_name]["fallback_score"]()
-                individual_results[agent_name] = {
+                result = {
                     f"{agent_name}_state": {
-                        "error": str(e),
+                        "error": str(result),
                         "fallback_score": fallback_score,
                     }
                 }
+            individual_results[agent_name] = result
 
-        # Phase 2: Consolidation Agents (sequential processing)
+        # Phase 2: Consolidation Agents (staged processing)
         print("🔄 Phase 2: Consolidation and validation...")
 
-        # Prepare context for consolidation agents
+        # Prepare context for consolidation agents (the results themselves are in the prompt body)
         consolidation_context = {
-            "individual_results": individual_results,
             "article_metadata": {
                 "title": article.get("title", ""),
                 "source": article.get("source", ""),
@@ -402,29 +734,44 @@ class NewsClassifierAgents:
             },
         }
 
-        # Run consolidation agents sequentially
-        consolidation_agents = [
-            "reflective_validator",
-            "human_reasoning",
-            "score_consolidator",
-            "consensus_agent",
-            "validator",
+        # Run consolidation stages in order; agents within a stage only read earlier stages and run
+        # concurrently. Every agent currently gets its own stage: each prompt includes all earlier
+        # results (human_reasoning reads reflective_validator's review, the consolidators read both)
+        consolidation_stages = [
+            ("reflective_validator",),
+            ("human_reasoning",),
+            ("score_consolidator",),
+            ("consensus_agent",),
+            ("validator",),
         ]
 
-        for agent_name in consolidation_agents:
-            try:
-                context_content = f"{content}\n\nPrevious Analysis Results:\n{json.dumps(individual_results, indent=2)}"
-                result = await self.call_agent(agent_name, context_content, consolidation_context)
-                individual_results[agent_name] = result
-            except Exception as e:
-                logger.error(f"Error in consolidation agent {agent_name}: {e}")
-                fallback_score = self.agent_configs[agent_name]["fallback_score"]()
-                individual_results[agent_name] = {
-                    f"{agent_name}_state": {
-                        "error": str(e),
-                        "fallback_score": fallback_score,
+        # Each agent's result is serialized once and reused by every later consolidation prompt
+        serialized_results: Dict[str, str] = {}
+
+        for stage in consolidation_stages:
+            for name, agent_result in individual_results.items():
+                if name not in serialized_results:
+                    # Same text _dumps_indented(individual_results) would produce for this entry
+                    entry = _dumps_indented(agent_result).replace("\n", "\n  ")
+                    serialized_results[name] = f"  {_dumps_indented(name)}: {entry}"
+            previous_results = "{\n" + ",\n".join(serialized_results.values()) + "\n}"
+            context_content = f"{content}\n\nPrevious Analysis Results:\n{previous_results}"
+
+            results = await asyncio.gather(
+                *(self.call_agent(agent_name, context_content, consolidation_context) for agent_name in stage),
+                return_exceptions=True,
+            )
+            for agent_name, result in zip(stage, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error in consolidation agent {agent_name}: {result}")
+                    fallback_score = self.agent_configs[agent_name]["fallback_score"]()
+                    result = {
+                        f"{agent_name}_state": {
+                            "error": str(result),
+                            "fallback_score": fallback_score,
+                        }
                     }
-                }
+                individual_results[agent_name] = result
 
         # Extract individual scores with proper mapping
         agent_scores = {}
@@ -436,31 +783,22 @@ class NewsClassifierAgents:
                 agent_scores[agent_name] = score
                 print(f"   {agent_name}: {score:.1f}/10")
 
-        # Calculate weighted scores with proper mapping
-        weighted_scores = {}
-        total_weight = 0
-
-        score_mappings = {
-            "context_evaluator": "context_score",
-            "fact_checker": "credibility_score",
-            "depth_analyzer": "depth_score",
-            "relevance_analyzer": "relevance_score",
-            "structure_analyzer": "structure_score",
-            "historical_reflection": "historical_score",
-            "reflective_validator": "reflective_score",
-            "human_reasoning": "human_reasoning_score",
-        }
+        # Calculate weighted scores with proper mapping (agents without a score are left out)
+        scores = np.array([agent_scores.get(agent_name, np.nan) for agent_name, _ in WEIGHTED_SCORE_KEYS])
+        scored = ~np.isnan(scores)
+        weighted = np.where(scored, scores, 0.0) * self.score_weights
+        total_weight = float(self.score_weights @ scored)
 
-        for agent_name, score_key in score_mappings.items():
-            if agent_name in agent_scores:
-                weight = self.agent_configs[agent_name]["weight"]
-                score = agent_scores[agent_name]
-                weighted_scores[score_key] = score * weight
-                total_weight += weight
-                print(f"   💰 {agent_name}: {score:.1f} * {weight:.2f} = {score * weight:.3f}")
+        weighted_scores = {}
+        for (agent_name, score_key), score, weight, value, has_score in zip(
+            WEIGHTED_SCORE_KEYS, scores, self.score_weights, weighted, scored
+        ):
+            if has_score:
+                weighted_scores[score_key] = float(value)
+                print(f"   💰 {agent_name}: {score:.1f} * {weight:.2f} = {value:.3f}")
 
         # Calculate final weighted score
-        final_weighted_score = sum(weighted_scores.values()) / total_weight if total_weight > 0 else 5.0
+        final_weighted_score = float(weighted.sum()) / total_weight if total_weight > 0 else 5.0
 
         # Get final validator score
         validator_score = agent_scores.get("validator", 5.0)
@@ -500,6 +838,29 @@ class NewsClassifierAgents:
         print(f"✅ Article processed successfully - Score: {final_weighted_score:.2f}/10")
         return result
 
+    async def process_articles(
+        self, articles: List[Union[Dict[str, Any], Any]], concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process many articles concurrently, returning results in input order
+
+        Articles are started shortest first so long ones do not hold up the rest of the batch.
+
+        Args:
+            articles: Articles (dicts or ArticleRecords)
+            concurrency: Articles in flight at once (default: AGENT_BATCH_CONCURRENCY env var, 8)
+        """
+        articles = [article if isinstance(article, dict) else article.to_dict() for article in articles]
+
+        async def process_one(i: int, article: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return await self.process_article(article)
+            except Exception as e:
+                logger.error(f"Error processing {article.get('title', 'Unknown')[:50]}: {e}")
+                return {**article, "processing_error": str(e)}
+
+        return await process_articles_shortest_first(articles, process_one, concurrency)
+
 
 # Create the graph for backward compatibility
 graph = NewsClassifierAgents()
@@ -511,6 +872,13 @@ async def process_article_with_agents(article: Dict[str, Any]) -> Dict[str, Any]
     return await graph.process_article(article)
 
 
+async def process_articles_with_agents(
+    articles: List[Dict[str, Any]], concurrency: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Process many articles through all agents concurrently"""
+    return await graph.process_articles(articles, concurrency)
+
+
 def get_agent_weights() -> Dict[str, float]:
     """Get agent weights for score calculation"""
     return {name: config["weight"] for name, config in graph.agent_configs.items()}
@@ -548,5 +916,31 @@ if __name__ == "__main__":
         print(f"Structure Score: {result['agent_scores']['structure_score']}/10")
         print("=" * 60)
 
-    # Run test
-    asyncio.run(test_single_article())
+    async def classify_file(input_path: str, output_path: Optional[str], concurrency: Optional[int]):
+        """Classify a JSON list of articles and write the results"""
+        with open(input_path, "r", encoding="utf-8") as f:
+            articles = json.load(f)
+
+        start = datetime.now()
+        results = await NewsClassifierAgents().process_articles(articles, concurrency)
+        elapsed = (datetime.now() - start).total_seconds()
+        print(f"✅ Classified {len(results)} articles in {elapsed:.1f}s")
+
+        output = json.dumps(results, indent=2, default=str)
+        if output_path:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(output)
+        else:
+            print(output)
+
+    parser = argparse.ArgumentParser(description="Classify news articles with the agent pipeline")
+    parser.add_argument("input", nargs="?", help="JSON file with a list of articles (omit to run a single test article)")
+    parser.add_argument("-o", "--output", help="Write results to this JSON file instead of stdout")
+    parser.add_argument("-c", "--concurrency", type=int, help="Articles processed at once (default 8)")
+    args = parser.parse_args()
+
+    if args.input:
+        asyncio.run(classify_file(args.input, args.output, args.concurrency))
+    else:
+        # Run test
+        asyncio.run(test_single_article())
@@ -37,21 +37,32 @@ Version: 2.0.0
 License: MIT
 """
 
+import asyncio
 import json
 import logging
 import os
 import random
 import re
 import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import feedparser
+import httpx
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    import ahocorasick
+
+    ahocorasick_available = True
+except ImportError:
+    ahocorasick_available = False
+
 # Configure comprehensive logging
 logging.basicConfig(
     level=logging.INFO,
@@ -63,12 +74,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Article text cleanup, compiled once: collapse whitespace, then drop anything but words and basic punctuation
+_WHITESPACE_RE = re.compile(r"\s+")
+_DISALLOWED_CHARS_RE = re.compile(r"[^\w\s\.\,\!\?\;\:\-\(\)]")
+# Punctuation stripped from titles before duplicate comparison
+_TITLE_PUNCT_RE = re.compile(r"[^\w\s]")
+
 
 class EnhancedCryptoMacroExtractor:
     """Enhanced news extractor for crypto and macroeconomic content"""
 
-    def __init__(self):
-        """Initialize the enhanced extractor"""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the enhanced extractor
+
+        Args:
+            client: Shared async HTTP client for safe_request_async (None = run safe_request in a thread)
+        """
+
+        self.client = client
 
         # Rotating user agents to avoid blocking
         self.user_agents = [
@@ -215,6 +239,14 @@ class EnhancedCryptoMacroExtractor:
             "bonds",
         ]
 
+        # One automaton over both keyword lists: a single pass over the text finds all of them
+        self._keyword_automaton = None
+        if ahocorasick_available:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for keyword in {*self.crypto_keywords, *self.macro_keywords}:
+                self._keyword_automaton.add_word(keyword, keyword)
+            self._keyword_automaton.make_automaton()
+
         self.extracted_articles = []
 
         logger.info("🚀 Enhanced Crypto & Macro Extractor initialized with 10 specialized sources")
@@ -268,14 +300,50 @@ class EnhancedCryptoMacroExtractor:
 
         return None
 
+    async def safe_request_async(self, url: str, timeout: int = 30, retries: int = 3) -> Optional[httpx.Response]:
+        """Async safe_request on the shared client: same retries and delays, without blocking the event loop"""
+        if self.client is None:
+            return await asyncio.to_thread(self.safe_request, url, timeout, retries)
+
+        for attempt in range(retries):
+            try:
+                # Add random delay to avoid rate limiting
+                await asyncio.sleep(random.uniform(1, 3))
+
+                response = await self.client.get(url, headers=self.get_headers(), timeout=timeout)
+
+                if response.status_code == 200:
+                    return response
+                elif response.status_code in [403, 401]:
+                    logger.warning(f"⚠️ Access denied ({response.status_code}) for {url}")
+                    return None
+                else:
+                    logger.warning(f"⚠️ HTTP {response.status_code} for {url}")
+
+            except httpx.TimeoutException:
+                logger.warning(f"⏰ Timeout on attempt {attempt + 1} for {url}")
+            except httpx.HTTPError as e:
+                logger.warning(f"🔗 Request error on attempt {attempt + 1} for {url}: {str(e)}")
+
+            if attempt < retries - 1:
+                delay = (attempt + 1) * 2
+                logger.info(f"⏳ Waiting {delay}s before retry {attempt + 2}")
+                await asyncio.sleep(delay)
+
+        return None
+
     def extract_content_from_url(self, url: str) -> Optional[str]:
         """Extract clean content from a URL with enhanced error handling"""
-        try:
-            response = self.safe_request(url)
-            if not response:
-                return None
+        response = self.safe_request(url)
+        if not response:
+            return None
+        return self.extract_article_content(response.content, url).get("content") or None
 
-            soup = BeautifulSoup(response.content, "html.parser")
+    def extract_article_content(self, html, url: str) -> Dict[str, str]:
+        """Extract title and clean content from an article page"""
+        try:
+            soup = BeautifulSoup(html, "html.parser")
+            title = soup.title.get_text(strip=True) if soup.title else ""
 
             # Remove unwanted elements
             for element in soup(["script", "style", "nav", "header", "footer", "aside", "advertisement"]):
@@ -305,18 +373,18 @@ class EnhancedCryptoMacroExtractor:
 
             # Fallback to paragraph extraction
             if not content_text:
-                paragraphs = soup.find_all("p")
-                content_text = " ".join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
+                paragraphs = (p.get_text(strip=True) for p in soup.find_all("p"))
+                content_text = " ".join([text for text in paragraphs if len(text) > 50])
 
             # Clean the content
-            content_text = re.sub(r"\s+", " ", content_text)
-            content_text = re.sub(r"[^\w\s\.\,\!\?\;\:\-\(\)]", "", content_text)
+            content_text = _WHITESPACE_RE.sub(" ", content_text)
+            content_text = _DISALLOWED_CHARS_RE.sub("", content_text)
 
-            return content_text[:5000] if content_text else None  # Limit content length
+            return {"title": title, "content": content_text[:5000]}  # Limit content length
 
         except Exception as e:
             logger.error(f"❌ Content extraction error for {url}: {str(e)}")
-            return None
+            return {"title": "", "content": ""}
 
     def is_recent_article(self, published_date: str, hours_limit: int = 48) -> bool:
         """Check if article is within the time limit (extended to 48 hours for more content)"""
@@ -360,8 +428,13 @@ class EnhancedCryptoMacroExtractor:
         full_text = f"{title} {description} {content}".lower()
 
         # Count keyword matches
-        crypto_matches = sum(1 for keyword in self.crypto_keywords if keyword in full_text)
-        macro_matches = sum(1 for keyword in self.macro_keywords if keyword in full_text)
+        if self._keyword_automaton is not None:
+            matched = {keyword for _, keyword in self._keyword_automaton.iter(full_text)}
+            crypto_matches = sum(1 for keyword in self.crypto_keywords if keyword in matched)
+            macro_matches = sum(1 for keyword in self.macro_keywords if keyword in matched)
+        else:
+            crypto_matches = sum(1 for keyword in self.crypto_keywords if keyword in full_text)
+            macro_matches = sum(1 for keyword in self.macro_keywords if keyword in full_text)
 
         total_matches = crypto_matches + macro_matches
 
@@ -376,6 +449,57 @@ class EnhancedCryptoMacroExtractor:
 
         return False, "other", 0
 
+    def _is_candidate_entry(self, entry) -> bool:
+        """Whether a feed entry has a url and title and is recent enough to fetch"""
+        if not entry.get("link", "") or not entry.get("title", ""):
+            return False
+        # Check if recent (extended to 48 hours)
+        return self.is_recent_article(entry.get("published", ""), hours_limit=24)
+
+    def _build_article(self, source_key: str, source_config: Dict, entry, content: Optional[str]) -> Optional[Dict]:
+        """Build the article dict for a fetched feed entry, or None if it is not crypto/macro content"""
+        title = entry.get("title", "")
+        description = entry.get("description", "") or entry.get("summary", "")
+
+        if not content or len(content) < 100:  # Lower minimum content length
+            content = description  # Use description as fallback
+
+        # Check crypto/macro relevance
+        is_relevant, category, relevance_score = self.is_crypto_or_macro_content(title, description, content)
+
+        if not (is_relevant and relevance_score >= 25):  # Lower threshold
+            return None
+
+        logger.info(f"✅ Added {category} article: {title[:50]}... (relevance: {relevance_score})")
+        return {
+            "url": entry["link"],
+            "title": title,
+            "description": description,
+            "content": content,
+            "source": source_key,
+            "published_date": entry.get("published", ""),
+            "author": entry.get("author", ""),
+            "tags": [tag.get("term") for tag in entry.get("tags", [])],
+            "quality_score": min(
+                100,
+                source_config["credibility"] + (len(content) // 50),
+            ),
+            "relevance_score": relevance_score,
+            "category": category,
+            "extraction_timestamp": datetime.now().isoformat(),
+        }
+
+    def _parse_feed(self, response, rss_url: str) -> List:
+        """Parse an RSS response and return the entries worth fetching"""
+        feed = feedparser.parse(response.content)
+
+        if not feed.entries:
+            logger.warning(f"⚠️ No entries found in RSS feed: {rss_url}")
+            return []
+
+        logger.info(f"📰 Found {len(feed.entries)} articles in feed")
+        return [entry for entry in feed.entries if self._is_candidate_entry(entry)]
+
     def extract_from_source(self, source_key: str, source_config: Dict) -> List[Dict]:
         """Extract articles from a specific source"""
         articles = []
@@ -390,65 +514,16 @@ class EnhancedCryptoMacroExtractor:
                 if not response:
                     continue
 
-                # Parse RSS feed
-                feed = feedparser.parse(response.content)
+                # Entries are pre-validated and fetch/parse errors are handled inside the helpers,
+                # so the feed-level handler is the only one needed
+                for entry in self._parse_feed(response, rss_url):
+                    # Extract full content
+                    logger.debug(f"🔍 Extracting content for: {entry['title'][:50]}...")
+                    content = self.extract_content_from_url(entry["link"])
 
-                if not feed.entries:
-                    logger.warning(f"⚠️ No entries found in RSS feed: {rss_url}")
-                    continue
-
-                logger.info(f"📰 Found {len(feed.entries)} articles in feed")
-
-                for entry in feed.entries:
-                    try:
-                        # Extract basic information
-                        title = getattr(entry, "title", "")
-                        description = getattr(entry, "description", "") or getattr(entry, "summary", "")
-                        url = getattr(entry, "link", "")
-                        published = getattr(entry, "published", "")
-
-                        if not url or not title:
-                            continue
-
-                        # Check if recent (extended to 48 hours)
-                        if not self.is_recent_article(published, hours_limit=24):
-                            continue
-
-                        # Extract full content
-                        logger.debug(f"🔍 Extracting content for: {title[:50]}...")
-                        content = self.extract_content_from_url(url)
-
-                        if not content or len(content) < 100:  # Lower minimum content length
-                            content = description  # Use description as fallback
-
-                        # Check crypto/macro relevance
-                        is_relevant, category, relevance_score = self.is_crypto_or_macro_content(title, description, content)
-
-                        if is_relevant and relevance_score >= 25:  # Lower threshold
-                            article = {
-                                "url": url,
-                                "title": title,
-                                "description": description,
-                                "content": content,
-                                "source": source_key,
-                                "published_date": published,
-                                "author": getattr(entry, "author", ""),
-                                "tags": [tag.term for tag in getattr(entry, "tags", [])],
-                                "quality_score": min(
-                                    100,
-                                    source_config["credibility"] + (len(content) // 50),
-                                ),
-                                "relevance_score": relevance_score,
-                                "category": category,
-                                "extraction_timestamp": datetime.now().isoformat(),
-                            }
-
-                            articles.append(article)
-                            logger.info(f"✅ Added {category} article: {title[:50]}... (relevance: {relevance_score})")
-
-                    except Exception as e:
-                        logger.error(f"❌ Error processing article from {rss_url}: {str(e)}")
-                        continue
+                    article = self._build_article(source_key, source_config, entry, content)
+                    if article:
+                        articles.append(article)
 
             except Exception as e:
                 logger.error(f"❌ Error processing RSS feed {rss_url}: {str(e)}")
@@ -457,6 +532,65 @@ class EnhancedCryptoMacroExtractor:
         logger.info(f"✅ {source_config['name']}: {len(articles)} articles extracted")
         return articles
 
+    async def _extract_content_from_url_async(self, url: str, semaphore: asyncio.Semaphore) -> Optional[str]:
+        """Async extract_content_from_url, holding a semaphore slot while the page is fetched"""
+        async with semaphore:
+            response = await self.safe_request_async(url)
+        if not response:
+            return None
+        return self.extract_article_content(response.content, url).get("content") or None
+
+    async def _extract_from_feed_async(
+        self, source_key: str, source_config: Dict, rss_url: str, semaphore: asyncio.Semaphore
+    ) -> List[Dict]:
+        """Fetch one RSS feed, then fetch all of its candidate article pages concurrently"""
+        try:
+            logger.info(f"📡 Fetching RSS: {rss_url}")
+
+            async with semaphore:
+                response = await self.safe_request_async(rss_url)
+            if not response:
+                return []
+
+            entries = self._parse_feed(response, rss_url)
+            contents = await asyncio.gather(
+                *(self._extract_content_from_url_async(entry["link"], semaphore) for entry in entries),
+                return_exceptions=True,
+            )
+
+            articles = []
+            for entry, content in zip(entries, contents):
+                if isinstance(content, Exception):
+                    logger.error(f"❌ Error processing article from {rss_url}: {str(content)}")
+                    continue
+
+                article = self._build_article(source_key, source_config, entry, content)
+                if article:
+                    articles.append(article)
+
+            return articles
+
+        except Exception as e:
+            logger.error(f"❌ Error processing RSS feed {rss_url}: {str(e)}")
+            return []
+
+    async def extract_from_source_async(
+        self, source_key: str, source_config: Dict, semaphore: asyncio.Semaphore
+    ) -> List[Dict]:
+        """Async extract_from_source: all feeds of the source are fetched concurrently"""
+        logger.info(f"🔍 Processing {source_config['name']} ({len(source_config['rss_urls'])} feeds)")
+
+        feeds = await asyncio.gather(
+            *(
+                self._extract_from_feed_async(source_key, source_config, rss_url, semaphore)
+                for rss_url in source_config["rss_urls"]
+            )
+        )
+        articles = [article for feed_articles in feeds for article in feed_articles]
+
+        logger.info(f"✅ {source_config['name']}: {len(articles)} articles extracted")
+        return articles
+
     def extract_all_articles(self, target_count: int = 150) -> List[Dict]:
         """Extract articles from all sources until target count is reached"""
         all_articles = []
@@ -480,6 +614,66 @@ class EnhancedCryptoMacroExtractor:
                 logger.error(f"❌ Error processing source {source_key}: {str(e)}")
                 continue
 
+        return self._select_articles(all_articles, target_count)
+
+    async def extract_all_articles_async(
+        self, target_count: int = 150, max_concurrency: int = 8, source_window: int = 2
+    ) -> List[Dict]:
+        """
+        Async extract_all_articles: the feeds and article pages of a source are fetched concurrently
+
+        Sources are processed in order, with at most source_window of them in flight,
+        and merged in the same order as the sequential version. Once target_count
+        articles are collected no further source is started and any still running
+        are cancelled, so publishers are not hit for articles that would be dropped.
+
+        Args:
+            target_count: Number of articles to return
+            max_concurrency: Maximum number of HTTP requests in flight at once
+            source_window: Maximum number of sources extracted at the same time
+        """
+        all_articles = []
+        semaphore = asyncio.Semaphore(max_concurrency)
+        sources = iter(self.sources.items())
+        running: Deque[Tuple[str, asyncio.Task]] = deque()
+
+        def start_sources(count: int):
+            for source_key, source_config in islice(sources, count):
+                task = asyncio.create_task(self.extract_from_source_async(source_key, source_config, semaphore))
+                running.append((source_key, task))
+
+        logger.info(f"🚀 Starting extraction with target: {target_count} articles")
+        logger.info("=" * 80)
+
+        start_sources(max(1, source_window))
+        try:
+            while running:
+                source_key, task = running.popleft()
+                try:
+                    articles = await task
+                except Exception as e:
+                    logger.error(f"❌ Error processing source {source_key}: {str(e)}")
+                    start_sources(1)
+                    continue
+
+                all_articles.extend(articles)
+                logger.info(f"📊 Total articles so far: {len(all_articles)}")
+
+                # Check if we've reached our target
+                if len(all_articles) >= target_count:
+                    logger.info(f"🎯 Target of {target_count} articles reached!")
+                    break
+
+                start_sources(1)
+        finally:
+            for _, task in running:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in running), return_exceptions=True)
+
+        return self._select_articles(all_articles, target_count)
+
+    def _select_articles(self, all_articles: List[Dict], target_count: int) -> List[Dict]:
+        """Deduplicate, rank and cut the extracted articles down to the target count"""
         # Remove duplicates based on URL and title similarity
         unique_articles = self.remove_duplicates(all_articles)
 
@@ -506,35 +700,34 @@ class EnhancedCryptoMacroExtractor:
     def remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
         """Remove duplicate articles based on URL and title similarity"""
         seen_urls = set()
-        seen_titles = set()
+        seen_title_words: List[set] = []  # Word set of each kept title, built once
         unique_articles = []
 
         for article in articles:
             url = article["url"]
-            title = article["title"].lower().strip()
-
-            # Simple title normalization for duplicate detection
-            normalized_title = re.sub(r"[^\w\s]", "", title)
-            title_words = set(normalized_title.split())
 
             # Check for URL duplicates
             if url in seen_urls:
                 continue
 
+            # Simple title normalization for duplicate detection
+            normalized_title = _TITLE_PUNCT_RE.sub("", article["title"].lower().strip())
+            title_words = set(normalized_title.split())
+
             # Check for similar titles (>70% word overlap)
             is_duplicate = False
-            for seen_title in seen_titles:
-                seen_words = set(seen_title.split())
-                if title_words and seen_words:
-                    overlap = len(title_words.intersection(seen_words))
-                    similarity = overlap / max(len(title_words), len(seen_words))
-                    if similarity > 0.7:
-                        is_duplicate = True
-                        break
+            if title_words:
+                for seen_words in seen_title_words:
+                    if seen_words:
+                        overlap = len(title_words.intersection(seen_words))
+                        similarity = overlap / max(len(title_words), len(seen_words))
+                        if similarity > 0.7:
+                            is_duplicate = True
+                            break
 
             if not is_duplicate:
                 seen_urls.add(url)
-                seen_titles.add(normalized_title)
+                seen_title_words.append(title_words)
                 unique_articles.append(article)
 
         removed_count = len(articles) - len(unique_articles)
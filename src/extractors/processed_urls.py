@@ -48,16 +48,13 @@ def process_urls(
             logger.warning(f"Excel file not found: {excel_file}")
             return False
 
-        # Read Excel file
-        df = pd.read_excel(excel_file)
+        # Read only the url column of the Excel file (a missing column yields an empty frame)
+        df = pd.read_excel(excel_file, usecols=lambda column: column == "url")
         logger.info(f"Processing {len(df)} URLs from {excel_file}")
 
-        # Extract URLs from DataFrame
-        urls_to_process = []
-        for _, row in df.iterrows():
-            url = row.get("url", "")
-            if url and isinstance(url, str):
-                urls_to_process.append(url.strip())
+        # Extract URLs from the column without building a row Series per URL
+        urls = df["url"].tolist() if "url" in df.columns else []
+        urls_to_process = [url.strip() for url in urls if url and isinstance(url, str)]
 
         if not urls_to_process:
             logger.warning("No URLs found in Excel file")
@@ -40,7 +40,7 @@ from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
-from src.agents.news_classifier_agents import NewsClassifierAgents
+from src.agents.news_classifier_agents import NewsClassifierAgents, process_articles_shortest_first
 from src.extractors.enhanced_crypto_macro_extractor import EnhancedCryptoMacroExtractor
 from src.services.duplicate_detection import DuplicateDetector
 from src.services.historical_archive_manager import HistoricalArchiveManager
@@ -76,6 +76,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-article report blocks: formatted from these templates and written with one call per article
+_TXT_ARTICLE_TEMPLATE = (
+    "ARTICLE {index}\n"
+    + "-" * 40
+    + "\nTitle: {title}\nSource: {source}\nCategory: {category}\nPublished: {published}\nURL: {url}\n"
+)
+_TXT_SCORES_TEMPLATE = (
+    "Overall Score: {overall:.1f}/10\nContext: {context:.1f}/10\nCredibility: {credibility:.1f}/10\n"
+    "Depth: {depth:.1f}/10\nRelevance: {relevance:.1f}/10\n"
+)
+_TXT_PREVIEW_TEMPLATE = "Content Preview: {preview}...\n\n"
+_SUMMARY_ARTICLE_TEMPLATE = "Article {index}: {title}...\nAgent Responses: {count}\nAgents: {agents}\n" + "-" * 40 + "\n"
+
 
 class EnhancedComprehensivePipeline:
     def __init__(self, target_articles: int = 30, output_dir: str = "enhanced_results"):
@@ -158,7 +171,7 @@ class EnhancedComprehensivePipeline:
             logger.info("=" * 80)
 
             self.stats["extraction_start"] = datetime.now()
-            articles = self.extractor.extract_all_articles(target_count=self.target_articles)
+            articles = await self.extractor.extract_all_articles_async(target_count=self.target_articles)
             self.stats["extraction_end"] = datetime.now()
 
             if not articles:
@@ -248,104 +261,117 @@ class EnhancedComprehensivePipeline:
             logger.error(f"❌ Pipeline execution failed: {e}")
             return {"success": False, "error": str(e), "statistics": self.stats}
 
-    async def process_articles_with_agents(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process articles through AI agents with enhanced memory integration"""
+    async def process_articles_with_agents(
+        self, articles: List[Dict[str, Any]], concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process articles through AI agents with enhanced memory integration
+
+        Articles run concurrently, shortest first, and are returned in input order.
+
+        Args:
+            articles: Extracted articles
+            concurrency: Articles in flight at once (default: AGENT_BATCH_CONCURRENCY env var, 8)
+        """
+
+        async def process_one(i: int, article: Dict[str, Any]) -> Dict[str, Any]:
+            return await self._process_article_with_agents(i + 1, len(articles), article)
+
+        return await process_articles_shortest_first(articles, process_one, concurrency)
+
+    async def _process_article_with_agents(self, i: int, total: int, article: Dict[str, Any]) -> Dict[str, Any]:
+        """Process one article through the agents and memory integrations (never raises)"""
 
-        processed_articles = []
+        try:
+            logger.info(f"🔄 Processing article {i}/{total}: {article.get('title', 'Unknown')[:50]}...")
+
+            # CONTEXT ENGINE INTEGRATION - Enhanced context preparation
+            if self.context_engine:
+                try:
+                    context_analysis = self.context_engine.analyze_context(
+                        article["content"], article.get("category", "unknown")
+                    )
+                    article["context_analysis"] = context_analysis
+                except Exception as e:
+                    logger.warning(f"Context engine analysis failed: {e}")
+
+            # WEIGHT MATRIX INTEGRATION - Get optimal weights
+            if self.weight_matrix:
+                try:
+                    optimal_weights = self.weight_matrix.get_optimal_configuration()
+                    article["weight_configuration"] = optimal_weights
+                except Exception as e:
+                    logger.warning(f"Weight matrix configuration failed: {e}")
 
-        for i, article in enumerate(articles, 1):
+            # Process through agent graph with enhanced context
             try:
-                logger.info(f"🔄 Processing article {i}/{len(articles)}: {article.get('title', 'Unknown')[:50]}...")
+                # Process article through all agents
+                processed_result = await self.agent_graph.process_article(article)
 
-                # CONTEXT ENGINE INTEGRATION - Enhanced context preparation
-                if self.context_engine:
+                # Update article with processed results
+                article.update(processed_result)
+
+                # Extract key scores for easier access
+                article["agent_scores"] = article.get("agent_scores", {})
+
+                # MEMORY AGENT INTEGRATION - Store processing results
+                if self.memory_agent:
                     try:
-                        context_analysis = self.context_engine.analyze_context(
-                            article["content"], article.get("category", "unknown")
+                        self.memory_agent.store_processing_result(
+                            article_id=article.get("url", f"article_{i}"),
+                            content_preview=article["content"][:500],
+                            agent_scores=article["agent_scores"],
+                            processing_metadata={
+                                "timestamp": datetime.now().isoformat(),
+                                "category": article.get("category", "unknown"),
+                                "source": article.get("source", "unknown"),
+                            },
                         )
-                        article["context_analysis"] = context_analysis
                     except Exception as e:
-                        logger.warning(f"Context engine analysis failed: {e}")
+                        logger.warning(f"Memory agent storage failed: {e}")
 
-                # WEIGHT MATRIX INTEGRATION - Get optimal weights
+                # WEIGHT MATRIX INTEGRATION - Update with results
                 if self.weight_matrix:
                     try:
-                        optimal_weights = self.weight_matrix.get_optimal_configuration()
-                        article["weight_configuration"] = optimal_weights
+                        self.weight_matrix.update_with_results(
+                            article_category=article.get("category", "unknown"),
+                            agent_scores=article["agent_scores"],
+                            final_score=article["agent_scores"].get("overall_score", 0),
+                        )
                     except Exception as e:
-                        logger.warning(f"Weight matrix configuration failed: {e}")
+                        logger.warning(f"Weight matrix update failed: {e}")
 
-                # Process through agent graph with enhanced context
-                try:
-                    # Process article through all agents
-                    processed_result = await self.agent_graph.process_article(article)
-
-                    # Update article with processed results
-                    article.update(processed_result)
-
-                    # Extract key scores for easier access
-                    article["agent_scores"] = article.get("agent_scores", {})
-
-                    # MEMORY AGENT INTEGRATION - Store processing results
-                    if self.memory_agent:
-                        try:
-                            self.memory_agent.store_processing_result(
-                                article_id=article.get("url", f"article_{i}"),
-                                content_preview=article["content"][:500],
-                                agent_scores=article["agent_scores"],
-                                processing_metadata={
-                                    "timestamp": datetime.now().isoformat(),
-                                    "category": article.get("category", "unknown"),
-                                    "source": article.get("source", "unknown"),
-                                },
-                            )
-                        except Exception as e:
-                            logger.warning(f"Memory agent storage failed: {e}")
-
-                    # WEIGHT MATRIX INTEGRATION - Update with results
-                    if self.weight_matrix:
-                        try:
-                            self.weight_matrix.update_with_results(
-                                article_category=article.get("category", "unknown"),
-                                agent_scores=article["agent_scores"],
-                                final_score=article["agent_scores"].get("overall_score", 0),
-                            )
-                        except Exception as e:
-                            logger.warning(f"Weight matrix update failed: {e}")
-
-                    self.stats["agent_responses_captured"] += len(article.get("ai_responses", {}))
-
-                except Exception as agent_error:
-                    logger.error(f"❌ Error processing article {i} through agents: {agent_error}")
-                    self.stats["articles_with_errors"] += 1
-
-                    # Add error information to article
-                    article["processing_error"] = str(agent_error)
-                    article["agent_scores"] = {
-                        "context_score": 0,
-                        "credibility_score": 0,
-                        "depth_score": 0,
-                        "relevance_score": 0,
-                        "structure_score": 0,
-                        "historical_score": 0,
-                        "reflective_score": 0,
-                        "human_reasoning_score": 0,
-                        "overall_score": 0,
-                    }
-
-                processed_articles.append(article)
-                self.stats["articles_processed"] += 1
+                self.stats["agent_responses_captured"] += len(article.get("ai_responses", {}))
 
-            except Exception as e:
-                logger.error(f"❌ Error processing article {i}: {e}")
+            except Exception as agent_error:
+                logger.error(f"❌ Error processing article {i} through agents: {agent_error}")
                 self.stats["articles_with_errors"] += 1
 
-                # Add minimal article info for consistency
-                article["processing_error"] = str(e)
-                article["agent_scores"] = {}
-                processed_articles.append(article)
+                # Add error information to article
+                article["processing_error"] = str(agent_error)
+                article["agent_scores"] = {
+                    "context_score": 0,
+                    "credibility_score": 0,
+                    "depth_score": 0,
+                    "relevance_score": 0,
+                    "structure_score": 0,
+                    "historical_score": 0,
+                    "reflective_score": 0,
+                    "human_reasoning_score": 0,
+                    "overall_score": 0,
+                }
+
+            self.stats["articles_processed"] += 1
+            return article
+
+        except Exception as e:
+            logger.error(f"❌ Error processing article {i}: {e}")
+            self.stats["articles_with_errors"] += 1
 
-        return processed_articles
+            # Add minimal article info for consistency
+            article["processing_error"] = str(e)
+            article["agent_scores"] = {}
+            return article
 
     async def generate_comprehensive_outputs(self, processed_articles: List[Dict[str, Any]]) -> Dict[str, str]:
         """Generate comprehensive output files with enhanced formatting"""
@@ -353,133 +379,16 @@ class EnhancedComprehensivePipeline:
         output_files = {}
 
         try:
-            # 1. Enhanced CSV Output
-            csv_data = []
-            for article in processed_articles:
-                row = {
-                    "title": article.get("title", ""),
-                    "url": article["url"],
-                    "published_date": article.get("published_date", ""),
-                    "quality_score": article.get("quality_score", 0),
-                    "relevance_score": article.get("relevance_score", 0),
-                    "description": article.get("description", "")[:200],  # Truncate for CSV
-                    "content_preview": (article["content"][:300] if article["content"] else ""),  # Preview
-                    "agent_count": article.get("agent_count", 0),
-                    "processing_status": (
-                        "success" if "ai_responses" in article and "error" not in article["ai_responses"] else "error"
-                    ),
-                }
-
-                # Add agent scores
-                agent_scores = article.get("agent_scores", {})
-                row.update(
-                    {
-                        "context_score": agent_scores.get("context_score", 0),
-                        "credibility_score": agent_scores.get("credibility_score", 0),
-                        "depth_score": agent_scores.get("depth_score", 0),
-                        "relevance_agent_score": agent_scores.get("relevance_score", 0),
-                        "human_reasoning_score": agent_scores.get("human_reasoning_score", 0),
-                        "overall_agent_score": agent_scores.get("overall_score", 0),
-                    }
-                )
-
-                csv_data.append(row)
-
-            # Save CSV
-            csv_file = f"{self.output_dir}/enhanced_results_{self.timestamp}.csv"
-            df = pd.DataFrame(csv_data)
-            df.to_csv(csv_file, index=False, encoding="utf-8")
-            output_files["csv"] = csv_file
-            logger.info(f"📄 Enhanced CSV created: {csv_file} ({len(csv_data)} rows)")
-
-            # 2. Complete JSON Output
-            json_file = f"{self.output_dir}/enhanced_results_{self.timestamp}.json"
-            json_data = {
-                "metadata": {
-                    "generation_timestamp": datetime.now().isoformat(),
-                    "pipeline_version": "4.0.0",
-                    "total_articles": len(processed_articles),
-                    "processing_duration_seconds": (
-                        (self.stats["processing_end"] - self.stats["processing_start"]).total_seconds()
-                        if self.stats["processing_end"] and self.stats["processing_start"]
-                        else 0
-                    ),
-                    "extraction_duration_seconds": (
-                        (self.stats["extraction_end"] - self.stats["extraction_start"]).total_seconds()
-                        if self.stats["extraction_end"] and self.stats["extraction_start"]
-                        else 0
-                    ),
-                    "ai_agents_used": 13,
-                    "target_articles": self.target_articles,
-                    "historical_archiving": True,
-                },
-                "statistics": self.stats,
-                "cleanup_summary": self.cleanup_summary,
-                "articles": processed_articles,
+            # 1-4. The CSV, JSON, text and agent summary files are independent: write them
+            # concurrently in worker threads instead of blocking the event loop on each in turn
+            writers = {
+                "csv": self._write_csv_output,
+                "json": self._write_json_output,
+                "txt": self._write_txt_output,
+                "agent_summary": self._write_agent_summary,
             }
-
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
-
-            output_files["json"] = json_file
-            logger.info(f"📄 Complete JSON created: {json_file}")
-
-            # 3. Human-Readable Text Output
-            txt_file = f"{self.output_dir}/enhanced_results_{self.timestamp}.txt"
-            with open(txt_file, "w", encoding="utf-8") as f:
-                f.write("ENHANCED CRYPTO & MACRO NEWS ANALYSIS RESULTS\n")
-                f.write("=" * 60 + "\n\n")
-                f.write(f"Generation Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total Articles: {len(processed_articles)}\n")
-                f.write(f"Crypto Articles: {self.stats['crypto_articles']}\n")
-                f.write(f"Macro Articles: {self.stats['macro_articles']}\n")
-                f.write(f"Processing Errors: {self.stats['articles_with_errors']}\n\n")
-
-                for i, article in enumerate(processed_articles, 1):
-                    f.write(f"ARTICLE {i}\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"Title: {article.get('title', 'N/A')}\n")
-                    f.write(f"Source: {article.get('source', 'N/A')}\n")
-                    f.write(f"Category: {article.get('category', 'N/A')}\n")
-                    f.write(f"Published: {article.get('published_date', 'N/A')}\n")
-                    f.write(f"URL: {article.get('url', 'N/A')}\n")
-
-                    # Agent scores
-                    agent_scores = article.get("agent_scores", {})
-                    if agent_scores:
-                        f.write(f"Overall Score: {agent_scores.get('overall_score', 0):.1f}/10\n")
-                        f.write(f"Context: {agent_scores.get('context_score', 0):.1f}/10\n")
-                        f.write(f"Credibility: {agent_scores.get('credibility_score', 0):.1f}/10\n")
-                        f.write(f"Depth: {agent_scores.get('depth_score', 0):.1f}/10\n")
-                        f.write(f"Relevance: {agent_scores.get('relevance_score', 0):.1f}/10\n")
-
-                    f.write(f"Content Preview: {article.get('content', '')[:200]}...\n")
-                    f.write("\n")
-
-            output_files["txt"] = txt_file
-            logger.info(f"📄 Human-readable TXT created: {txt_file}")
-
-            # 4. Agent Responses Summary
-            agent_summary_file = f"{self.output_dir}/agent_responses_summary_{self.timestamp}.txt"
-            with open(agent_summary_file, "w", encoding="utf-8") as f:
-                f.write("AI AGENT RESPONSES SUMMARY\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Total Articles Processed: {len(processed_articles)}\n")
-                f.write(f"Total Agent Responses: {self.stats['agent_responses_captured']}\n")
-                f.write(
-                    f"Average Responses per Article: {self.stats['agent_responses_captured'] / len(processed_articles) if processed_articles else 0:.1f}\n\n"
-                )
-
-                for i, article in enumerate(processed_articles, 1):
-                    ai_responses = article.get("ai_responses", {})
-                    if ai_responses:
-                        f.write(f"Article {i}: {article.get('title', 'N/A')[:50]}...\n")
-                        f.write(f"Agent Responses: {len(ai_responses)}\n")
-                        f.write(f"Agents: {', '.join(ai_responses.keys())}\n")
-                        f.write("-" * 40 + "\n")
-
-            output_files["agent_summary"] = agent_summary_file
-            logger.info(f"📄 Agent responses summary created: {agent_summary_file}")
+            paths = await asyncio.gather(*(asyncio.to_thread(writer, processed_articles) for writer in writers.values()))
+            output_files.update(zip(writers, paths))
 
             # 5. Pipeline Report
             report_file = f"{self.output_dir}/pipeline_report_{self.timestamp}.md"
@@ -542,6 +451,148 @@ class EnhancedComprehensivePipeline:
             logger.error(f"❌ Error generating outputs: {e}")
             return {}
 
+    def _write_csv_output(self, processed_articles: List[Dict[str, Any]]) -> str:
+        """Write the per-article CSV with agent scores"""
+        csv_data = []
+        for article in processed_articles:
+            row = {
+                "title": article.get("title", ""),
+                "url": article["url"],
+                "published_date": article.get("published_date", ""),
+                "quality_score": article.get("quality_score", 0),
+                "relevance_score": article.get("relevance_score", 0),
+                "description": article.get("description", "")[:200],  # Truncate for CSV
+                "content_preview": (article["content"][:300] if article["content"] else ""),  # Preview
+                "agent_count": article.get("agent_count", 0),
+                "processing_status": (
+                    "success" if "ai_responses" in article and "error" not in article["ai_responses"] else "error"
+                ),
+            }
+
+            # Add agent scores
+            agent_scores = article.get("agent_scores", {})
+            row.update(
+                {
+                    "context_score": agent_scores.get("context_score", 0),
+                    "credibility_score": agent_scores.get("credibility_score", 0),
+                    "depth_score": agent_scores.get("depth_score", 0),
+                    "relevance_agent_score": agent_scores.get("relevance_score", 0),
+                    "human_reasoning_score": agent_scores.get("human_reasoning_score", 0),
+                    "overall_agent_score": agent_scores.get("overall_score", 0),
+                }
+            )
+
+            csv_data.append(row)
+
+        # Save CSV
+        csv_file = f"{self.output_dir}/enhanced_results_{self.timestamp}.csv"
+        df = pd.DataFrame(csv_data)
+        df.to_csv(csv_file, index=False, encoding="utf-8")
+        logger.info(f"📄 Enhanced CSV created: {csv_file} ({len(csv_data)} rows)")
+
+        return csv_file
+
+    def _write_json_output(self, processed_articles: List[Dict[str, Any]]) -> str:
+        """Write the complete JSON output (metadata, statistics and full articles)"""
+        json_file = f"{self.output_dir}/enhanced_results_{self.timestamp}.json"
+        json_data = {
+            "metadata": {
+                "generation_timestamp": datetime.now().isoformat(),
+                "pipeline_version": "4.0.0",
+                "total_articles": len(processed_articles),
+                "processing_duration_seconds": (
+                    (self.stats["processing_end"] - self.stats["processing_start"]).total_seconds()
+                    if self.stats["processing_end"] and self.stats["processing_start"]
+                    else 0
+                ),
+                "extraction_duration_seconds": (
+                    (self.stats["extraction_end"] - self.stats["extraction_start"]).total_seconds()
+                    if self.stats["extraction_end"] and self.stats["extraction_start"]
+                    else 0
+                ),
+                "ai_agents_used": 13,
+                "target_articles": self.target_articles,
+                "historical_archiving": True,
+            },
+            "statistics": self.stats,
+            "cleanup_summary": self.cleanup_summary,
+            "articles": processed_articles,
+        }
+
+        with open(json_file, "w", encoding="utf-8") as f:
+            json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
+
+        logger.info(f"📄 Complete JSON created: {json_file}")
+
+        return json_file
+
+    def _write_txt_output(self, processed_articles: List[Dict[str, Any]]) -> str:
+        """Write the human-readable text report"""
+        txt_file = f"{self.output_dir}/enhanced_results_{self.timestamp}.txt"
+        with open(txt_file, "w", encoding="utf-8") as f:
+            f.write("ENHANCED CRYPTO & MACRO NEWS ANALYSIS RESULTS\n")
+            f.write("=" * 60 + "\n\n")
+            f.write(f"Generation Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Total Articles: {len(processed_articles)}\n")
+            f.write(f"Crypto Articles: {self.stats['crypto_articles']}\n")
+            f.write(f"Macro Articles: {self.stats['macro_articles']}\n")
+            f.write(f"Processing Errors: {self.stats['articles_with_errors']}\n\n")
+
+            for i, article in enumerate(processed_articles, 1):
+                block = _TXT_ARTICLE_TEMPLATE.format(
+                    index=i,
+                    title=article.get("title", "N/A"),
+                    source=article.get("source", "N/A"),
+                    category=article.get("category", "N/A"),
+                    published=article.get("published_date", "N/A"),
+                    url=article.get("url", "N/A"),
+                )
+
+                # Agent scores
+                agent_scores = article.get("agent_scores", {})
+                if agent_scores:
+                    block += _TXT_SCORES_TEMPLATE.format(
+                        overall=agent_scores.get("overall_score", 0),
+                        context=agent_scores.get("context_score", 0),
+                        credibility=agent_scores.get("credibility_score", 0),
+                        depth=agent_scores.get("depth_score", 0),
+                        relevance=agent_scores.get("relevance_score", 0),
+                    )
+
+                f.write(block + _TXT_PREVIEW_TEMPLATE.format(preview=article.get("content", "")[:200]))
+
+        logger.info(f"📄 Human-readable TXT created: {txt_file}")
+
+        return txt_file
+
+    def _write_agent_summary(self, processed_articles: List[Dict[str, Any]]) -> str:
+        """Write the agent responses summary"""
+        agent_summary_file = f"{self.output_dir}/agent_responses_summary_{self.timestamp}.txt"
+        with open(agent_summary_file, "w", encoding="utf-8") as f:
+            f.write("AI AGENT RESPONSES SUMMARY\n")
+            f.write("=" * 50 + "\n\n")
+            f.write(f"Total Articles Processed: {len(processed_articles)}\n")
+            f.write(f"Total Agent Responses: {self.stats['agent_responses_captured']}\n")
+            f.write(
+                f"Average Responses per Article: {self.stats['agent_responses_captured'] / len(processed_articles) if processed_articles else 0:.1f}\n\n"
+            )
+
+            for i, article in enumerate(processed_articles, 1):
+                ai_responses = article.get("ai_responses", {})
+                if ai_responses:
+                    f.write(
+                        _SUMMARY_ARTICLE_TEMPLATE.format(
+                            index=i,
+                            title=article.get("title", "N/A")[:50],
+                            count=len(ai_responses),
+                            agents=", ".join(ai_responses.keys()),
+                        )
+                    )
+
+        logger.info(f"📄 Agent responses summary created: {agent_summary_file}")
+
+        return agent_summary_file
+
     def _extract_agent_scores(self, agent_responses: Dict[str, Any]) -> Dict[str, float]:
         """Extract agent scores from responses for easier access"""
 
@@ -1,9 +1,16 @@
 import json
 import re
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 from urllib.parse import urlparse
 
+try:
+    import ahocorasick
+
+    ahocorasick_available = True
+except ImportError:
+    ahocorasick_available = False
+
 
 class FINIntegration:
     """
@@ -103,6 +110,50 @@ class FINIntegration:
             "worry",
         ]
 
+        self.crypto_keywords = [
+            "bitcoin",
+            "ethereum",
+            "crypto",
+            "blockchain",
+            "btc",
+            "eth",
+            "defi",
+            "nft",
+        ]
+
+        # One automaton over every keyword list: a single pass over the text finds all of them
+        # (overlapping matches included, so "bull" and "bullish" both count as before)
+        self._keyword_automaton = None
+        if ahocorasick_available:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for keyword in {
+                *self.high_impact_keywords,
+                *self.medium_impact_keywords,
+                *self.positive_keywords,
+                *self.negative_keywords,
+                *self.crypto_keywords,
+            }:
+                self._keyword_automaton.add_word(keyword, keyword)
+            self._keyword_automaton.make_automaton()
+
+    def match_keywords(self, content: str) -> FrozenSet[str]:
+        """Keywords from any keyword list that occur in the content (case-insensitive substring match)"""
+        content_lower = content.lower()
+        if self._keyword_automaton is not None:
+            return frozenset(keyword for _, keyword in self._keyword_automaton.iter(content_lower))
+        return frozenset(
+            keyword
+            for keywords in (
+                self.high_impact_keywords,
+                self.medium_impact_keywords,
+                self.positive_keywords,
+                self.negative_keywords,
+                self.crypto_keywords,
+            )
+            for keyword in keywords
+            if keyword in content_lower
+        )
+
     def get_domain_credibility(self, url: str) -> int:
         """Get credibility score for a domain"""
         try:
@@ -111,12 +162,13 @@ class FINIntegration:
         except Exception:
             return self.domain_credibility["default"]
 
-    def analyze_sentiment(self, content: str) -> Dict:
-        """Analyze sentiment of the content"""
-        content_lower = content.lower()
+    def analyze_sentiment(self, content: str, matched: Optional[FrozenSet[str]] = None) -> Dict:
+        """Analyze sentiment of the content (matched: precomputed match_keywords(content))"""
+        if matched is None:
+            matched = self.match_keywords(content)
 
-        positive_count = sum(1 for keyword in self.positive_keywords if keyword in content_lower)
-        negative_count = sum(1 for keyword in self.negative_keywords if keyword in content_lower)
+        positive_count = sum(1 for keyword in self.positive_keywords if keyword in matched)
+        negative_count = sum(1 for keyword in self.negative_keywords if keyword in matched)
 
         if positive_count > negative_count:
             sentiment = "bullish"
@@ -135,12 +187,13 @@ class FINIntegration:
             "negative_indicators": negative_count,
         }
 
-    def assess_market_impact(self, content: str) -> str:
-        """Assess potential market impact"""
-        content_lower = content.lower()
+    def assess_market_impact(self, content: str, matched: Optional[FrozenSet[str]] = None) -> str:
+        """Assess potential market impact (matched: precomputed match_keywords(content))"""
+        if matched is None:
+            matched = self.match_keywords(content)
 
-        high_impact_count = sum(1 for keyword in self.high_impact_keywords if keyword in content_lower)
-        medium_impact_count = sum(1 for keyword in self.medium_impact_keywords if keyword in content_lower)
+        high_impact_count = sum(1 for keyword in self.high_impact_keywords if keyword in matched)
+        medium_impact_count = sum(1 for keyword in self.medium_impact_keywords if keyword in matched)
 
         if high_impact_count >= 2:
             return "high"
@@ -149,20 +202,11 @@ class FINIntegration:
         else:
             return "low"
 
-    def count_crypto_mentions(self, content: str) -> int:
-        """Count cryptocurrency mentions"""
-        crypto_keywords = [
-            "bitcoin",
-            "ethereum",
-            "crypto",
-            "blockchain",
-            "btc",
-            "eth",
-            "defi",
-            "nft",
-        ]
-        content_lower = content.lower()
-        return sum(1 for keyword in crypto_keywords if keyword in content_lower)
+    def count_crypto_mentions(self, content: str, matched: Optional[FrozenSet[str]] = None) -> int:
+        """Count cryptocurrency mentions (matched: precomputed match_keywords(content))"""
+        if matched is None:
+            matched = self.match_keywords(content)
+        return sum(1 for keyword in self.crypto_keywords if keyword in matched)
 
     def analyze_article(self, url: str, content: str, title: str = "") -> Dict:
         """
@@ -177,18 +221,19 @@ class FINIntegration:
             Dictionary with analysis results
         """
         full_text = f"{title} {content}"
+        matched = self.match_keywords(full_text)
 
         # Get domain credibility
         domain_credibility = self.get_domain_credibility(url)
 
         # Analyze sentiment
-        sentiment_analysis = self.analyze_sentiment(full_text)
+        sentiment_analysis = self.analyze_sentiment(full_text, matched)
 
         # Assess market impact
-        market_impact = self.assess_market_impact(full_text)
+        market_impact = self.assess_market_impact(full_text, matched)
 
         # Count crypto mentions
-        crypto_mentions = self.count_crypto_mentions(full_text)
+        crypto_mentions = self.count_crypto_mentions(full_text, matched)
 
         # Calculate overall credibility score
         base_score = domain_credibility
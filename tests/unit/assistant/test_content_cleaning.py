@@ -0,0 +1,61 @@
+"""
+Unit tests for assistant content cleaning.
+
+This module tests the content type detection done by
+clean_and_structure_content, including overlapping indicators.
+"""
+
+import pytest
+
+from assistant import utils
+from assistant.utils import clean_and_structure_content
+
+
+def _page(body: str) -> str:
+    return f"<html><head><title>Market update</title></head><body><p>{body}</p></body></html>"
+
+
+@pytest.fixture(params=[True, False], ids=["selectolax", "beautifulsoup"])
+def parser(request, monkeypatch):
+    """Run each test with both HTML parsers (selectolax only when installed)"""
+    if request.param and not utils.selectolax_available:
+        pytest.skip("selectolax not installed")
+    monkeypatch.setattr(utils, "selectolax_available", request.param)
+
+
+class TestContentTypeDetection:
+    """Test suite for clean_and_structure_content content type detection"""
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "Read the opinionews digest for today",  # blog indicator overlapping the start of "news"
+            "The blogreport covers ETF flows",
+            "Thoughts from our desk: the exchange announced new listings",
+        ],
+    )
+    def test_overlapping_or_later_news_indicator_wins(self, parser, body):
+        """Test a news indicator is found even when it overlaps or follows a blog indicator"""
+        result = clean_and_structure_content(_page(body))
+
+        assert result["metadata"]["content_type"] == "news_article"
+
+    def test_news_beats_blog(self, parser):
+        """Test text with both news and blog indicators is typed as news"""
+        result = clean_and_structure_content(_page("An opinion blog about the latest NEWS on bitcoin"))
+
+        assert result["metadata"]["content_type"] == "news_article"
+
+    def test_blog_indicators_only(self, parser):
+        """Test text with only blog indicators is typed as a blog post"""
+        result = clean_and_structure_content(_page("My Thoughts on staking: an opinion piece"))
+
+        assert result["metadata"]["content_type"] == "blog_post"
+
+    def test_no_indicators(self, parser):
+        """Test text without indicators has unknown content type"""
+        result = clean_and_structure_content(_page("Bitcoin traded sideways all week"))
+
+        assert result["metadata"]["content_type"] == "unknown"
+        assert result["metadata"]["title"] == "Market update"
+        assert result["cleaned_content"].endswith("Bitcoin traded sideways all week")
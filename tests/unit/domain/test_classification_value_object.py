@@ -0,0 +1,76 @@
+"""
+Unit tests for Classification value object.
+
+This module tests score-to-category banding at the category boundaries
+and the final score range validation.
+"""
+
+import math
+
+import pytest
+
+from domain.value_objects import Classification, ClassificationCategory
+
+SUMMARY = "Bitcoin ETF inflows reach a record high."
+RATIONALE = "Well sourced report with verifiable figures and balanced context."
+
+# (lower bound, category from that bound, category just below it)
+CATEGORY_BOUNDARIES = [
+    (2.1, ClassificationCategory.POOR, ClassificationCategory.VERY_POOR),
+    (3.1, ClassificationCategory.FAIR, ClassificationCategory.POOR),
+    (5.1, ClassificationCategory.GOOD, ClassificationCategory.FAIR),
+    (6.6, ClassificationCategory.VERY_GOOD, ClassificationCategory.GOOD),
+    (7.6, ClassificationCategory.EXCELLENT, ClassificationCategory.VERY_GOOD),
+    (8.6, ClassificationCategory.OUTSTANDING, ClassificationCategory.EXCELLENT),
+]
+
+
+class TestClassificationValueObject:
+    """Test suite for Classification value object"""
+
+    @pytest.mark.parametrize("boundary, category, _below", CATEGORY_BOUNDARIES)
+    def test_category_at_boundary(self, boundary, category, _below):
+        """Test a score exactly on a lower bound falls in the higher category"""
+        classification = Classification.create_from_score(boundary, SUMMARY, RATIONALE)
+
+        assert classification.category == category
+        assert not classification.has_warnings()
+
+    @pytest.mark.parametrize("boundary, _category, below", CATEGORY_BOUNDARIES)
+    def test_category_just_below_boundary(self, boundary, _category, below):
+        """Test scores just under a lower bound stay in the category below it"""
+        for score in (math.nextafter(boundary, 0.0), round(boundary - 0.01, 2)):
+            assert Classification.create_from_score(score, SUMMARY, RATIONALE).category == below
+
+    @pytest.mark.parametrize(
+        "score, category",
+        [(0.1, ClassificationCategory.VERY_POOR), (10.0, ClassificationCategory.OUTSTANDING)],
+    )
+    def test_category_at_score_range_limits(self, score, category):
+        """Test the lowest and highest valid scores map to the outer categories"""
+        assert Classification.create_from_score(score, SUMMARY, RATIONALE).category == category
+
+    def test_category_mismatch_adds_warning(self):
+        """Test a category that does not match the score is kept with a warning"""
+        classification = Classification.create_from_score(7.6, SUMMARY, RATIONALE)
+        mismatched = Classification(
+            final_score=7.59,
+            category=classification.category,
+            quality_level=classification.quality_level,
+            summary=SUMMARY,
+            rationale=RATIONALE,
+        )
+
+        assert mismatched.category == ClassificationCategory.EXCELLENT
+        assert any("expected 'Very Good'" in warning for warning in mismatched.warnings)
+
+    @pytest.mark.parametrize("score", [0.0, 0.09, 10.01, math.inf, -math.inf])
+    def test_final_score_out_of_range(self, score):
+        """Test scores outside 0.1-10.0 are rejected"""
+        with pytest.raises(ValueError, match="Final score must be between 0.1 and 10.0"):
+            Classification.create_from_score(score, SUMMARY, RATIONALE)
+
+    def test_final_score_nan_rejected(self):
+        """Test a NaN final score is rejected"""
+        with pytest.raises(ValueError, match="Final score must be between 0.1 and 10.0"):
+            Classification.create_from_score(math.nan, SUMMARY, RATIONALE)
@@ -0,0 +1,120 @@
+"""
+Unit tests for APIAdapter response caches.
+
+This module tests that cached responses are returned as copies and that
+the direct AI health probe never answers from the agent cache.
+"""
+
+import asyncio
+
+import pytest
+
+from infrastructure.mcp_adapter import api_adapter
+from infrastructure.mcp_adapter.api_adapter import APIAdapter
+
+
+class FakeLLM:
+    """LangChain-style chat model that succeeds for the first `healthy_calls` calls, then fails"""
+
+    class Response:
+        content = "ok"
+
+    def __init__(self, healthy_calls: int):
+        self.healthy_calls = healthy_calls
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        if self.calls > self.healthy_calls:
+            raise RuntimeError("OpenAI unavailable")
+        return self.Response()
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Direct-mode adapter whose health results are never reused"""
+    monkeypatch.setattr(api_adapter, "HEALTH_CACHE_SECONDS", 0.0)
+    return APIAdapter(use_mcp=False)
+
+
+def _use_llm(adapter: APIAdapter, llm: FakeLLM):
+    adapter.__dict__["llm"] = llm  # Replaces the cached property
+
+
+class TestAgentCache:
+    """Test suite for the agent prompt cache and the AI health probe"""
+
+    def test_health_probe_is_not_served_from_cache(self, adapter):
+        """Test the AI probe calls the model every time and sees it go down"""
+        llm = FakeLLM(healthy_calls=1)
+        _use_llm(adapter, llm)
+
+        async def check_twice():
+            return await adapter.health_check(), await adapter.health_check()
+
+        first, second = asyncio.run(check_twice())
+
+        assert first["services"]["direct_ai"] == "healthy"
+        assert second["services"]["direct_ai"] == "unhealthy"
+        assert llm.calls == 2
+
+    def test_identical_prompt_is_cached(self, adapter):
+        """Test an identical prompt is answered from the cache"""
+        llm = FakeLLM(healthy_calls=1)
+        _use_llm(adapter, llm)
+        messages = [{"role": "user", "content": "Classify this article"}]
+
+        async def classify_twice():
+            return await adapter.ai_agent_classify(messages), await adapter.ai_agent_classify(messages)
+
+        first, second = asyncio.run(classify_twice())
+
+        assert first["success"] and second["success"]
+        assert llm.calls == 1
+
+    def test_cache_hit_is_a_copy(self, adapter):
+        """Test modifying a returned result does not change later cache hits"""
+        _use_llm(adapter, FakeLLM(healthy_calls=1))
+        messages = [{"role": "user", "content": "Classify this article"}]
+
+        async def classify_and_modify():
+            first = await adapter.ai_agent_classify(messages)
+            first["response"] = "modified"
+            second = await adapter.ai_agent_classify(messages)
+            second["response"] = "modified again"
+            return await adapter.ai_agent_classify(messages)
+
+        assert asyncio.run(classify_and_modify())["response"] == "ok"
+
+    def test_agent_cache_entries_expire(self, adapter):
+        """Test the agent cache is bounded by a TTL"""
+        assert adapter._agent_cache.ttl == api_adapter.AGENT_CACHE_TTL
+
+
+class TestClassificationCache:
+    """Test suite for near-duplicate classification cache hits"""
+
+    CACHED = {"success": True, "article_title": "Bitcoin tops $70k", "source": "coindesk", "final_score": 7.2}
+
+    @pytest.fixture
+    def near_duplicate_hit(self, adapter, monkeypatch):
+        """Make every classification lookup hit the result stored for another article"""
+        monkeypatch.setattr(adapter._sem_cache, "semantic", False)
+        monkeypatch.setattr(adapter._sem_cache, "get", lambda query, source="": self.CACHED)
+        return adapter
+
+    def test_hit_is_labelled_for_the_request(self, near_duplicate_hit):
+        """Test a near-duplicate hit carries this request's title and leaves the cache untouched"""
+        result = asyncio.run(near_duplicate_hit.classify_news_article("Body", "Bitcoin climbs past $70,000", "coindesk"))
+
+        assert result["article_title"] == "Bitcoin climbs past $70,000"
+        assert result["final_score"] == 7.2
+        assert self.CACHED["article_title"] == "Bitcoin tops $70k"
+
+    def test_batch_hits_are_labelled_per_article(self, near_duplicate_hit):
+        """Test batch cache hits are labelled with each article's own title"""
+        articles = [{"title": "BTC at $70k", "content": "Body", "source": "coindesk"}]
+        results = asyncio.run(near_duplicate_hit.classify_news_articles_batch(articles))
+
+        assert results[0]["article_title"] == "BTC at $70k"
+        assert self.CACHED["article_title"] == "Bitcoin tops $70k"
@@ -0,0 +1,178 @@
+"""
+Unit tests for the APIAdapter provider fallback chain.
+
+This module tests execute_with_fallback's health gating, failover and
+stale-cache behavior with fake providers and a fake monotonic clock.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from infrastructure.mcp_adapter import reliability
+from infrastructure.mcp_adapter.api_adapter import APIAdapter
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic clock"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class FakeProvider:
+    """Provider call returning (or raising) the queued outcomes, repeating the last one"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+MCP_DOWN = {"error": "MCP tool call failed: connection refused", "fallback": True, "provider_error": True}
+MCP_TOOL_ERROR = {"error": "MCP tool error: 404", "fallback": True, "provider_error": False}
+OK = {"success": True, "articles": []}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the clock used by provider health tracking"""
+    fake = FakeClock()
+    monkeypatch.setattr(reliability, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def adapter():
+    """Direct-mode adapter; tests pass their own providers"""
+    return APIAdapter(use_mcp=False)
+
+
+def run(adapter, operation, providers, stale_key=None):
+    return asyncio.run(adapter.execute_with_fallback(operation, providers, stale_key))
+
+
+class TestExecuteWithFallback:
+    """Test suite for APIAdapter.execute_with_fallback"""
+
+    def test_skips_provider_above_failure_threshold(self, adapter, clock):
+        """Test a provider with repeated provider-level failures is skipped"""
+        mcp, direct = FakeProvider(OK, MCP_DOWN), FakeProvider(OK)
+        providers = [("mcp", mcp), ("direct", direct)]
+
+        # 1 failure in 2 calls is still within the 50% threshold; 2 in 3 is not
+        for _ in range(3):
+            run(adapter, "fetch_rss_feed", providers)
+        result = run(adapter, "fetch_rss_feed", providers)
+
+        assert mcp.calls == 3
+        assert direct.calls == 3
+        assert result["provider"] == "direct"
+        assert result["fallback_from"] == ["mcp"]
+        assert adapter.fallback_counts["mcp"] == 2
+
+    def test_skipped_provider_is_probed(self, adapter, clock):
+        """Test a skipped provider is tried again after the probe interval"""
+        mcp, direct = FakeProvider(MCP_DOWN, OK), FakeProvider(OK)
+        providers = [("mcp", mcp), ("direct", direct)]
+        run(adapter, "fetch_rss_feed", providers)
+
+        clock.advance(29)
+        run(adapter, "fetch_rss_feed", providers)
+        assert mcp.calls == 1
+
+        clock.advance(1)
+        result = run(adapter, "fetch_rss_feed", providers)
+        assert mcp.calls == 2
+        assert result == OK
+
+    def test_request_errors_do_not_mark_provider_down(self, adapter, clock):
+        """Test per-request errors fail over without gating later calls"""
+        mcp, direct = FakeProvider(MCP_TOOL_ERROR), FakeProvider(OK)
+        providers = [("mcp", mcp), ("direct", direct)]
+
+        for _ in range(5):
+            result = run(adapter, "scrape_web_content", providers)
+
+        assert mcp.calls == 5
+        assert result["provider"] == "direct"
+        assert result["fallback_from"] == ["mcp"]
+
+    def test_raised_provider_errors_count_as_failures(self, adapter, clock):
+        """Test transport exceptions raised by a provider mark it down"""
+        mcp, direct = FakeProvider(httpx.ConnectError("connection refused")), FakeProvider(OK)
+        providers = [("mcp", mcp), ("direct", direct)]
+
+        for _ in range(3):
+            run(adapter, "classify_news_article", providers)
+
+        assert mcp.calls == 1
+        assert direct.calls == 3
+
+    def test_last_provider_is_always_tried(self, adapter, clock):
+        """Test the last provider in the chain is never health-skipped"""
+        direct = FakeProvider(httpx.ConnectError("connection refused"))
+
+        for _ in range(5):
+            result = run(adapter, "ai_agent_classify", [("direct", direct)])
+
+        assert direct.calls == 5
+        assert result["error"] == "connection refused"
+
+    def test_bad_feeds_do_not_block_other_feeds(self, adapter, clock, monkeypatch):
+        """Test 403s on some feeds leave the direct provider available for the next one"""
+        fetches = []
+
+        async def fetch(url, source_name, max_articles=50):
+            fetches.append(url)
+            if "blocked" in url:
+                return {"error": "HTTP 403 Forbidden", "url": url}
+            return {"success": True, "source": source_name, "articles": []}
+
+        monkeypatch.setattr(adapter, "_direct_fetch_rss", fetch)
+
+        async def fetch_feeds():
+            for i in range(3):
+                await adapter.fetch_rss_feed(f"https://blocked.example/{i}.xml", "Blocked")
+            return await adapter.fetch_rss_feed("https://ok.example/feed.xml", "OK")
+
+        result = asyncio.run(fetch_feeds())
+
+        assert result["success"]
+        assert fetches[-1] == "https://ok.example/feed.xml"
+
+    def test_serves_stale_response_when_all_providers_fail(self, adapter, clock):
+        """Test the last good response for a key is returned when every provider fails"""
+        stale_key = adapter._stale_responses.key("fetch_rss_feed", "https://example.com/feed.xml")
+        mcp, direct = FakeProvider(OK, MCP_DOWN), FakeProvider({"error": "HTTP 503"})
+        providers = [("mcp", mcp), ("direct", direct)]
+
+        assert run(adapter, "fetch_rss_feed", providers, stale_key) == OK
+        result = run(adapter, "fetch_rss_feed", providers, stale_key)
+
+        assert result["success"]
+        assert result["provider"] == "stale_cache"
+        assert result["fallback_from"] == ["mcp", "direct"]
+
+    def test_error_returned_without_stale_response(self, adapter, clock):
+        """Test the last provider's error is returned when nothing is cached"""
+        direct = FakeProvider({"error": "HTTP 404", "url": "https://example.com/missing"})
+        stale_key = adapter._stale_responses.key("scrape_web_content", "https://example.com/missing")
+
+        result = run(adapter, "scrape_web_content", [("direct", direct)], stale_key)
+
+        assert result["error"] == "HTTP 404"
+        assert result["fallback_from"] == ["direct"]
@@ -0,0 +1,215 @@
+"""
+Unit tests for MCP call reliability primitives.
+
+This module tests the circuit breaker, bulkhead, provider health tracker
+and error classification against a fake monotonic clock.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from infrastructure.mcp_adapter import reliability
+from infrastructure.mcp_adapter.reliability import (
+    Bulkhead,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ProviderHealth,
+    is_provider_error,
+    is_retryable_error,
+)
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic clock"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the clock used by the reliability module"""
+    fake = FakeClock()
+    monkeypatch.setattr(reliability, "time", fake)
+    return fake
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://mcp.test/tools/fetch_rss_feed")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status_code}", request=request, response=response)
+
+
+class TestErrorClassification:
+    """Test suite for retryable and provider-level error classification"""
+
+    @pytest.mark.parametrize("status_code", [429, 500, 503])
+    def test_server_errors_are_retryable_provider_errors(self, status_code):
+        """Test 429 and 5xx responses are retried and count against the provider"""
+        error = _status_error(status_code)
+        assert is_retryable_error(error)
+        assert is_provider_error(error)
+
+    @pytest.mark.parametrize("status_code", [400, 403, 404])
+    def test_client_errors_are_not_provider_errors(self, status_code):
+        """Test per-request client errors neither retry nor mark the provider down"""
+        error = _status_error(status_code)
+        assert not is_retryable_error(error)
+        assert not is_provider_error(error)
+
+    def test_transport_errors_and_open_circuit_are_provider_errors(self):
+        """Test connection failures, timeouts and an open circuit mark the provider down"""
+        assert is_provider_error(httpx.ConnectError("connection refused"))
+        assert is_provider_error(httpx.ReadTimeout("timed out"))
+        assert is_provider_error(CircuitOpenError("MCP circuit open"))
+
+    def test_other_exceptions_are_not_provider_errors(self):
+        """Test content and programming errors do not mark the provider down"""
+        assert not is_provider_error(ValueError("No AI model available"))
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker"""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test the circuit opens once failure_threshold failures happen in a row"""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self, clock):
+        """Test a success between failures keeps the circuit closed"""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_after_recovery_timeout(self, clock):
+        """Test trial calls are allowed once recovery_timeout has passed"""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+
+        clock.advance(29.9)
+        assert breaker.state is CircuitState.OPEN
+
+        clock.advance(0.1)
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+
+    def test_half_open_trial_outcome(self, clock):
+        """Test a failed trial reopens the circuit and a successful one closes it"""
+        breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+        for _ in range(5):
+            breaker.record_failure()
+        clock.advance(30)
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+        clock.advance(30)
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestBulkhead:
+    """Test suite for Bulkhead"""
+
+    def test_limits_calls_in_flight(self):
+        """Test no more than capacity calls run at once"""
+        bulkhead = Bulkhead(capacity=2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with bulkhead:
+                peak = max(peak, bulkhead.in_flight)
+                await asyncio.sleep(0)
+
+        async def run():
+            await asyncio.gather(*(call() for _ in range(6)))
+
+        asyncio.run(run())
+
+        assert peak == 2
+        assert bulkhead.in_flight == 0
+
+
+class TestProviderHealth:
+    """Test suite for ProviderHealth"""
+
+    def test_allows_up_to_max_failure_rate(self, clock):
+        """Test a provider at exactly max_failure_rate is still tried"""
+        health = ProviderHealth(max_failure_rate=0.5)
+        health.record(True)
+        health.record(False)
+
+        assert health.failure_rate == 0.5
+        assert health.allow_request()
+
+    def test_skips_above_max_failure_rate(self, clock):
+        """Test a provider failing more than max_failure_rate of calls is skipped"""
+        health = ProviderHealth(max_failure_rate=0.5)
+        health.record(True)
+        health.record(False)
+        health.record(False)
+
+        assert not health.allow_request()
+
+    def test_probe_interval(self, clock):
+        """Test a skipped provider gets one probe call every probe_interval seconds"""
+        health = ProviderHealth(window=600, probe_interval=30)
+        health.record(False)
+
+        clock.advance(29)
+        assert not health.allow_request()
+
+        clock.advance(1)
+        assert health.allow_request()
+        assert not health.allow_request()
+
+        clock.advance(30)
+        assert health.allow_request()
+
+    def test_failed_probe_delays_next_probe(self, clock):
+        """Test the next probe is due probe_interval after the latest failure"""
+        health = ProviderHealth(window=600, probe_interval=30)
+        health.record(False)
+        clock.advance(30)
+        assert health.allow_request()
+
+        clock.advance(10)
+        health.record(False)
+
+        clock.advance(20)
+        assert not health.allow_request()
+        clock.advance(10)
+        assert health.allow_request()
+
+    def test_failures_expire_after_window(self, clock):
+        """Test failures older than the window no longer count"""
+        health = ProviderHealth(window=60, probe_interval=30)
+        health.record(False)
+        clock.advance(59)
+        assert health.failure_rate == 1.0
+
+        clock.advance(2)
+        assert health.failure_rate == 0.0
+        assert health.allow_request()